@@ -39,12 +39,14 @@ from dataclasses import dataclass
 from enum import IntEnum
 from pathlib import Path
 from types import ModuleType
-from typing import Callable, Optional, Sequence, Tuple
+from typing import TYPE_CHECKING, Callable, Optional, Sequence, Tuple
 
 from core.logger import configure_logging, error, info
-from core.oblique_engine import ObliqueEngine
-from core.oblique_patch import ObliquePatch
 from core.paths import resolve_asset_path
+
+if TYPE_CHECKING:
+    from core.oblique_patch import ObliquePatch
+
 REPL_SANDBOX_DIR_NAME = ".oblique"
 
 
@@ -82,6 +84,10 @@ class PatchReference:
     def load_module(self, reload: bool = False) -> ModuleType:
         """Return a module object for this patch reference."""
 
+        if reload:
+            # Make files saved since the last import visible to the path finders
+            importlib.invalidate_caches()
+
         if self.kind == "module":
             try:
                 if reload and self.module_name in sys.modules:
@@ -316,6 +322,10 @@ def run_start(args: argparse.Namespace) -> ExitCode:
         error(f"Unexpected error while loading patch: {exc}")
         return ExitCode.INTERNAL
 
+    # Imported here so subcommands that never open a window don't load
+    # glfw, moderngl and sounddevice at startup
+    from core.oblique_engine import ObliqueEngine
+
     engine = ObliqueEngine(
         patch=patch,
         width=config.width,
@@ -26,14 +26,13 @@ import os
 import shutil
 import subprocess
 from pathlib import Path
-from typing import Optional
 
 import moderngl
 import numpy as np
 from PIL import Image
 
 from core.frame_analysis import analyze_frame, analyze_temporal
-from core.logger import info, warning
+from core.logger import info
 from core.oblique_patch import ObliquePatch
 from core.renderer import cleanup_last_good_cache, cleanup_shader_cache, cleanup_texture_cache, set_ctx
 
@@ -101,8 +100,11 @@ class HeadlessRenderer:
         module = self.patch.tick(t)
         tex = module.render_texture(self.ctx, self.width, self.height, t)
         raw = tex.read()
-        arr = np.frombuffer(raw, dtype=np.float32).reshape(self.height, self.width, 4)
-        return arr[::-1].copy()  # flip Y: OpenGL origin is bottom-left
+        # Half-float render targets (``texture_dtype = "f2"``) read back as
+        # float16; widen them so callers always see float32.
+        src_dtype = np.float16 if tex.dtype == "f2" else np.float32
+        arr = np.frombuffer(raw, dtype=src_dtype).reshape(self.height, self.width, 4)
+        return arr[::-1].astype(np.float32)  # flip Y: OpenGL origin is bottom-left
 
     def render_to_image(self, t: float) -> Image.Image:
         """Render one frame and return a :class:`PIL.Image.Image` (RGBA)."""
@@ -10,9 +10,10 @@ GLSL 330 context provided by macOS' Metal backed driver.  Other platforms have
 not been tested.
 """
 
+import functools
 import threading
 import time
-from typing import Dict, Optional
+from typing import Any, Callable, Dict, Optional
 
 import glfw  # type: ignore
 import moderngl
@@ -24,6 +25,78 @@ from core.performance_monitor import PerformanceMonitor
 from core.paths import resolve_asset_path
 from inputs.audio.core.base_audio_input import BaseAudioInput
 
+# Frames between performance stats reports in the render loop
+STATS_INTERVAL_FRAMES = 60
+
+# Final stretch of each frame wait that is busy-waited instead of slept, since
+# time.sleep can overshoot its target by up to a scheduler tick
+SPIN_THRESHOLD = 0.001
+
+
+def sleep_until(deadline: float, wait: Callable[[float], Any] = time.sleep) -> None:
+    """Block until ``time.perf_counter()`` reaches ``deadline``.
+
+    Waits through most of the interval and spins on the clock for the last
+    :data:`SPIN_THRESHOLD` seconds, keeping frame pacing accurate without burning
+    CPU for the whole budget.
+
+    Args:
+        deadline (float): Target time on the ``time.perf_counter()`` clock.
+        wait (Callable[[float], Any]): Blocking wait taking a timeout in seconds.
+            It may return early (e.g. ``glfw.wait_events_timeout`` when a window
+            event arrives); the remaining time is then waited again.
+    """
+    while True:
+        remaining = deadline - time.perf_counter()
+        if remaining <= SPIN_THRESHOLD:
+            break
+        wait(remaining - SPIN_THRESHOLD)
+    while time.perf_counter() < deadline:
+        pass
+
+
+def next_frame_deadline(deadline: float, frame_duration: float) -> float:
+    """Return the deadline of the frame after the one due at ``deadline``.
+
+    Deadlines advance on a fixed grid so per-frame timing error doesn't accumulate.
+    When a frame has overrun past the next slot, the grid restarts from now instead
+    of rushing frames out to catch up.
+
+    Args:
+        deadline (float): Deadline of the frame just presented (``perf_counter`` time).
+        frame_duration (float): Target frame period in seconds.
+
+    Returns:
+        float: Deadline of the next frame.
+    """
+    deadline += frame_duration
+    now = time.perf_counter()
+    if deadline < now:
+        deadline = now + frame_duration
+    return deadline
+
+
+def warm_up_patch(patch: ObliquePatch, ctx: moderngl.Context, t: float = 0.0) -> None:
+    """Compile the shaders of the patch's graph at time ``t`` before it renders.
+
+    This calls ``patch.tick(t)`` once, which is not side-effect free: stateful
+    operators in the tick callback (e.g. an :class:`Envelope`'s decay) advance one
+    step, and the graph is built for ``t``. Pass the time the next frame will
+    render at, so a reloaded patch is warmed for the current time rather than 0.
+
+    A failure here is logged and otherwise ignored: the same tick or shader error
+    surfaces again on the first rendered frame, where the render loop reports it.
+
+    Args:
+        patch (ObliquePatch): Patch whose ``tick(t)`` graph is compiled.
+        ctx (moderngl.Context): Context the shaders will be rendered with.
+        t (float): Patch time to build the graph at, in seconds.
+    """
+    try:
+        patch.tick(t).warmup(ctx)
+    except Exception as e:
+        warning(f"Shader warm-up failed, compiling on first frame instead: {e}")
+
 
 class ObliqueEngine:
     """Coordinate input capture, processing and shader based rendering.
@@ -112,8 +185,12 @@ class ObliqueEngine:
             # Setup window and OpenGL context
             self._create_window()
 
+            # Compile the starting graph's shaders before the clock starts, so the
+            # first frame doesn't stall on GLSL compilation
+            warm_up_patch(self.patch, self.ctx)
+
             # Initialize timing
-            self.start_time = time.time()
+            self.start_time = time.perf_counter()
             self.running = True
 
             info(f"Starting Oblique engine with patch {self.patch}")
@@ -130,29 +207,37 @@ class ObliqueEngine:
                 )
                 self.audio_thread.start()
 
-            # Main render loop
-            while not glfw.window_should_close(self.window):
+            # Per-frame state, bound to locals for the loop
+            window = self.window
+            patch = self.patch
+            pm = self.performance_monitor
+            start_time = self.start_time
+            frame_duration = self.frame_duration
+            frames_until_stats = STATS_INTERVAL_FRAMES
+
+            # Main render loop; each frame is presented at a fixed deadline
+            next_deadline = time.perf_counter() + frame_duration
+            should_close = functools.partial(glfw.window_should_close, window)
+            while not should_close():
                 # Performance monitoring
-                if self.performance_monitor:
-                    self.performance_monitor.begin_frame()
+                if pm:
+                    pm.begin_frame()
 
-                frame_start = time.time()
-                t = frame_start - self.start_time
+                t = time.perf_counter() - start_time
 
-                # Render modules
-                self._render_patch(t, self.patch)
+                # Render modules, holding the buffer swap until the frame's deadline
+                self._render_patch(t, patch, next_deadline)
 
                 # Performance monitoring
-                if self.performance_monitor:
-                    self.performance_monitor.end_frame()
-                    self.performance_monitor.print_stats(every_n_frames=60)
+                if pm:
+                    pm.end_frame()
+                    # Count down here so frames between reports skip the call entirely
+                    frames_until_stats -= 1
+                    if frames_until_stats == 0:
+                        frames_until_stats = STATS_INTERVAL_FRAMES
+                        pm.print_stats(every_n_frames=1)
 
-                # Frame rate limiting
-                frame_end = time.time()
-                elapsed = frame_end - frame_start
-                sleep_time = self.frame_duration - elapsed
-                if sleep_time > 0:
-                    time.sleep(sleep_time)
+                next_deadline = next_frame_deadline(next_deadline, frame_duration)
 
         except Exception as e:
             error(f"Error in Oblique engine: {e}")
@@ -315,7 +400,7 @@ class ObliqueEngine:
                             chunk = chunk[:, :channels]
 
                         # Write to stream with error handling
-                        stream.write(chunk.astype("float32"))
+                        stream.write(chunk.astype("float32", copy=False))
                         chunks_processed += 1
 
                         # Monitor timing for buffer underruns
@@ -348,12 +433,13 @@ class ObliqueEngine:
         except Exception as e:
             error(f"[AUDIO ERROR] Stream setup failed: {e}")
 
-    def _render_patch(self, t: float, patch: ObliquePatch):
+    def _render_patch(self, t: float, patch: ObliquePatch, deadline: Optional[float] = None):
         """
         Render all modules in the patch and blend them together.
 
         Args:
             t: Current time in seconds
+            deadline: Optional ``perf_counter`` time to hold the buffer swap until
 
         Returns:
             The final composited texture
@@ -369,19 +455,20 @@ class ObliqueEngine:
         final_tex = module.render_texture(self.ctx, fb_width, fb_height, t)
 
         # Display frame
-        self._display_frame(final_tex, t)
+        self._display_frame(final_tex, t, deadline)
 
         # Handle events
         glfw.poll_events()
 
 
-    def _display_frame(self, final_tex: moderngl.Texture, t: float) -> None:
+    def _display_frame(self, final_tex: moderngl.Texture, t: float, deadline: Optional[float] = None) -> None:
         """
         Display the final composited texture to the screen using cached resources.
 
         Args:
             final_tex: The final composited texture
             t: Current time in seconds
+            deadline: Optional ``perf_counter`` time to hold the buffer swap until
         """
         if self.ctx is None or self._display_program is None or self._display_vao is None:
             raise RuntimeError("OpenGL context or display resources not initialized")
@@ -399,7 +486,11 @@ class ObliqueEngine:
         # Render using cached VAO
         self._display_vao.render(moderngl.TRIANGLE_STRIP)
 
-        # Swap buffers
+        # Swap buffers, waiting out the rest of the frame first so frames are
+        # presented on a steady cadence rather than whenever rendering finishes
+        if deadline is not None:
+            # Service window events while waiting instead of leaving them queued
+            sleep_until(deadline, glfw.wait_events_timeout)
         glfw.swap_buffers(self.window)
 
 
@@ -1,4 +1,4 @@
-from typing import Callable, List, Optional
+from typing import Callable, Optional
 
 from inputs.audio.core.base_audio_input import BaseAudioInput
 from modules.core.base_av_module import BaseAVModule
@@ -35,6 +35,9 @@ class ShaderCacheEntry:
 _shader_cache: dict[str, ShaderCacheEntry] = {}
 _last_good_cache: dict[str, ShaderCacheEntry] = {}
 _texture_cache: OrderedDict[str, moderngl.Texture] = OrderedDict()
+# Framebuffer wrapping each cached texture, keyed like _texture_cache, so off-screen
+# passes (including both ping-pong targets) reuse their FBO instead of creating one per frame
+_framebuffer_cache: dict[str, "moderngl.Framebuffer"] = {}
 _TEXTURE_CACHE_MAX_SIZE = 64
 _hot_reload_shaders_enabled = False
 _debug_mode = False
@@ -112,6 +115,8 @@ def cleanup_texture_cache() -> None:
     subsequent contexts do not receive stale texture handles.
     """
     global _texture_cache
+    for key in list(_framebuffer_cache):
+        _release_framebuffer(key)
     for tex in _texture_cache.values():
         try:
             tex.release()
@@ -120,10 +125,21 @@ def cleanup_texture_cache() -> None:
     _texture_cache.clear()
 
 
+def _release_framebuffer(cache_key: str) -> None:
+    """Release the cached framebuffer attached to the texture under *cache_key*, if any."""
+    fbo = _framebuffer_cache.pop(cache_key, None)
+    if fbo is not None:
+        try:
+            fbo.release()
+        except Exception:
+            pass
+
+
 def _enforce_texture_cache_limit() -> None:
     """Evict least-recently-used textures when cache exceeds its size cap."""
     while len(_texture_cache) > _TEXTURE_CACHE_MAX_SIZE:
-        _, stale = _texture_cache.popitem(last=False)
+        key, stale = _texture_cache.popitem(last=False)
+        _release_framebuffer(key)
         try:
             stale.release()
         except Exception:
@@ -135,6 +151,7 @@ def release_texture_reference(texture: moderngl.Texture) -> None:
     keys = [key for key, cached in _texture_cache.items() if cached is texture]
     for key in keys:
         _texture_cache.pop(key, None)
+        _release_framebuffer(key)
 
     try:
         texture.release()
@@ -159,22 +176,15 @@ def _release_shader_cache_entry(entry: ShaderCacheEntry) -> None:
             warning("Failed to release program")
 
 
-def render_fullscreen_quad(
-    ctx: moderngl.Context, frag_shader_path: str, uniforms: dict[str, Any]
+def _load_shader(
+    ctx: moderngl.Context, frag_shader_path: str
 ) -> tuple[moderngl.Program, moderngl.VertexArray, moderngl.Buffer]:
-    """Draw a fullscreen quad with a stock vertex shader.
-
-    The fragment shader is compiled and paired with a minimal vertex shader that
-    outputs a fullscreen triangle strip—mirroring Shadertoy where all creative
-    logic lives in the fragment shader.  Compiled programs and buffers are
-    cached for reuse.
+    """Return the cached ``(program, vao, vbo)`` for a fragment shader, compiling it if needed.
 
-    Returns
-    -------
-    tuple
-        ``(program, vao, vbo)`` for optional manual management.
+    Honours hot reload (recompiles when the file changed) and falls back to the
+    last successfully compiled program when a recompile fails.
     """
-    global _shader_cache, _last_good_cache, _hot_reload_shaders_enabled, _debug_mode
+    global _shader_cache, _last_good_cache, _hot_reload_shaders_enabled
 
     resolved_path = str(resolve_asset_path(frag_shader_path))
 
@@ -249,6 +259,34 @@ def render_fullscreen_quad(
     else:
         cached_entry = _shader_cache[resolved_path]
         program, vao, vbo = cached_entry.program, cached_entry.vao, cached_entry.vbo
+    return program, vao, vbo
+
+
+def precompile_shader(ctx: moderngl.Context, frag_shader_path: str) -> None:
+    """Compile and cache a fragment shader ahead of its first draw.
+
+    Lets callers move GLSL compilation out of the first rendered frame; see
+    :meth:`~modules.core.base_av_module.BaseAVModule.warmup`.
+    """
+    _load_shader(ctx, frag_shader_path)
+
+
+def render_fullscreen_quad(
+    ctx: moderngl.Context, frag_shader_path: str, uniforms: dict[str, Any]
+) -> tuple[moderngl.Program, moderngl.VertexArray, moderngl.Buffer]:
+    """Draw a fullscreen quad with a stock vertex shader.
+
+    The fragment shader is compiled and paired with a minimal vertex shader that
+    outputs a fullscreen triangle strip—mirroring Shadertoy where all creative
+    logic lives in the fragment shader.  Compiled programs and buffers are
+    cached for reuse.
+
+    Returns
+    -------
+    tuple
+        ``(program, vao, vbo)`` for optional manual management.
+    """
+    program, vao, vbo = _load_shader(ctx, frag_shader_path)
 
     if _debug_mode:
         shader_uniforms = _program_binding_names(program)
@@ -287,7 +325,8 @@ def render_to_texture(
     frag_shader_path: str,
     uniforms: "Uniforms",
     filter: int = moderngl.NEAREST,
-    cache_tag: str = ""
+    cache_tag: str = "",
+    dtype: str = "f4",
 ) -> moderngl.Texture:
     """Render a module pass to an off‑screen texture.
 
@@ -296,7 +335,8 @@ def render_to_texture(
     :func:`render_fullscreen_quad`.
 
     The optional ``cache_tag`` creates distinct cache entries for multiple
-    off‑screen passes of identical resolution within a module.
+    off‑screen passes of identical resolution within a module. ``dtype`` selects
+    the component type of the render target (``"f4"``, ``"f2"`` or ``"f1"``).
     """
     global _texture_cache
     global _ctx
@@ -304,18 +344,23 @@ def render_to_texture(
     if _ctx is None:
         raise RuntimeError("OpenGL Context not set")
 
-    cache_key = f"{module.__class__.__name__}_{cache_tag}_{width}_{height}_{filter}"
+    cache_key = f"{module.__class__.__name__}_{cache_tag}_{width}_{height}_{filter}_{dtype}"
 
-    if cache_key in _texture_cache:
-        tex = _texture_cache[cache_key]
-        _texture_cache.move_to_end(cache_key)
-    else:
-        tex = _ctx.texture((width, height), 4, dtype="f4", alignment=1)
+    new_texture = cache_key not in _texture_cache
+    if new_texture:
+        tex = _ctx.texture((width, height), 4, dtype=dtype, alignment=1)
         tex.filter = (filter, filter)
         tex.repeat_x = False
         tex.repeat_y = False
+        fbo = None
+    else:
+        tex = _texture_cache[cache_key]
+        _texture_cache.move_to_end(cache_key)
+        fbo = _framebuffer_cache.get(cache_key)
 
-    fbo = _ctx.framebuffer(color_attachments=[tex])
+    new_fbo = fbo is None
+    if new_fbo:
+        fbo = _ctx.framebuffer(color_attachments=[tex])
     try:
         _ctx.viewport = (0, 0, width, height)
         fbo.use()
@@ -325,10 +370,17 @@ def render_to_texture(
         render_fullscreen_quad(_ctx, frag_shader_path, dict(uniforms))
     except Exception as e:
         error(f"Error rendering to texture: {e}")
+        # Only cache the framebuffer together with its texture, after a successful
+        # render; otherwise a later call would draw through it into a lost texture
+        for resource, created in ((fbo, new_fbo), (tex, new_texture)):
+            if created:
+                try:
+                    resource.release()
+                except Exception:
+                    pass
         raise e
-    finally:
-        fbo.release()
 
+    _framebuffer_cache[cache_key] = fbo
     _texture_cache[cache_key] = tex
     _texture_cache.move_to_end(cache_key)
     _enforce_texture_cache_limit()
@@ -50,6 +50,9 @@ class AudioDeviceInput(BaseAudioInput):
         self._max_channels = 0  # Will be set in start() method
         self._last_chunk = None  # Initialize for peek()
         self._chunk_history = collections.deque(maxlen=self.HISTORY_SIZE)
+        # Latest-chunk peek results per channel selection: (source chunk, filtered array).
+        # Every consumer peeking the same chunk gets the same array, built once.
+        self._peek_cache: Dict[Optional[tuple], tuple] = {}
 
         # Get device info
         device_info = cast(Dict[str, Any], sd.query_devices(self.device_id, "input"))
@@ -101,6 +104,7 @@ class AudioDeviceInput(BaseAudioInput):
         self._running = True
         self._stream.start()
         self._chunk_history.clear()
+        self._peek_cache.clear()
 
     def stop(self) -> None:
         """
@@ -120,6 +124,7 @@ class AudioDeviceInput(BaseAudioInput):
                 break
         self._last_chunk = None
         self._chunk_history.clear()
+        self._peek_cache.clear()
 
     def _audio_callback(self, indata: np.ndarray, frames: int, time_info, status) -> None:
         """
@@ -184,8 +189,9 @@ class AudioDeviceInput(BaseAudioInput):
         try:
             # Wait for the next chunk with a timeout
             chunk = self._audio_queue.get(timeout=0.1)  # 100ms timeout
-            # Store the unfiltered chunk in history
-            self._chunk_history.append(chunk.copy())
+            # Store the unfiltered chunk in history; the callback already copied it
+            # out of PortAudio's buffer and nothing else holds a reference
+            self._chunk_history.append(chunk)
             # Apply channel filtering for the return value
             filtered_chunk = self._filter_channels(chunk, channels)
             # Ensure the result is C-contiguous for sounddevice compatibility
@@ -222,6 +228,8 @@ class AudioDeviceInput(BaseAudioInput):
 
         if n_buffers <= 0 or len(self._chunk_history) == 0:
             return None
+        if n_buffers == 1:
+            return self._peek_latest(channels)
         # Get up to n_buffers most recent chunks (these are unfiltered)
         if n_buffers > self.HISTORY_SIZE:
             warning(f"peek: requested n_buffers {n_buffers} is greater than chunk history max size {self.HISTORY_SIZE}")
@@ -234,6 +242,20 @@ class AudioDeviceInput(BaseAudioInput):
         filtered_result = self._filter_channels(concatenated, channels)
         return np.ascontiguousarray(filtered_result, dtype=np.float32)
 
+    def _peek_latest(self, channels: Optional[List[int]]) -> np.ndarray:
+        """
+        Return the latest chunk filtered to *channels*, reusing the previous result while
+        no new chunk has arrived so repeated peeks within a frame don't copy again.
+        """
+        latest = self._chunk_history[-1]
+        key = tuple(channels) if channels is not None else None
+        cached = self._peek_cache.get(key)
+        if cached is not None and cached[0] is latest:
+            return cached[1]
+        result = self._filter_channels(latest, channels)
+        self._peek_cache[key] = (latest, result)
+        return result
+
     def get_channel_audio_input(self, channels: List[int]) -> "AudioDeviceChannelInput":
         """
         Get a new AudioDeviceChannelInput instance that captures only the specified channels.
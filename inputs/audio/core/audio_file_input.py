@@ -60,7 +60,8 @@ class AudioFileInput(BaseAudioInput):
         self._last_chunk = None  # Initialize for peek()
         self._chunk_history = collections.deque(maxlen=self.HISTORY_SIZE)    
         try:
-            self._buffer, self.samplerate = sf.read(self.file_path, always_2d=True)
+            # Decode straight to float32 so every downstream operator stays single precision
+            self._buffer, self.samplerate = sf.read(self.file_path, always_2d=True, dtype="float32")
         except Exception as e:
             error_msg = f"Failed to read audio file '{self.file_path}': {e}"
             info(error_msg)
@@ -7,6 +7,7 @@ in a subprocess for parameter sliders, telemetry, and log output.
 from __future__ import annotations
 
 import argparse
+import functools
 import importlib
 import os
 import sys
@@ -15,11 +16,15 @@ import time
 from pathlib import Path
 
 from core.logger import configure_logging, error, info, warning, set_log_sink
-from core.oblique_engine import ObliqueEngine
+from core.oblique_engine import ObliqueEngine, next_frame_deadline, warm_up_patch
 
 
-def _load_patch(module_name: str, func_name: str, width: int, height: int):
-    module = importlib.import_module(module_name)
+def _load_patch(module_name: str, func_name: str, width: int, height: int, reload: bool = False):
+    module = sys.modules.get(module_name) if reload else None
+    if module is not None:
+        module = importlib.reload(module)
+    else:
+        module = importlib.import_module(module_name)
     factory = getattr(module, func_name)
     return factory(width, height)
 
@@ -40,6 +45,8 @@ def main() -> None:
     parser.add_argument("--log-file", default=None)
 
     args = parser.parse_args()
+    patch_path, patch_function = args.patch_path, args.patch_function
+    width, height = args.width, args.height
 
     configure_logging(
         level=args.log_level,
@@ -95,7 +102,7 @@ def main() -> None:
 
     # Load patch
     try:
-        patch = _load_patch(args.patch_path, args.patch_function, args.width, args.height)
+        patch = _load_patch(patch_path, patch_function, width, height)
     except Exception as exc:
         error(f"Failed to load patch: {exc}")
         bridge.send_log("ERROR", f"Failed to load patch: {exc}")
@@ -111,7 +118,7 @@ def main() -> None:
     sys.stderr = _devnull
 
     module_file = None
-    module_obj = sys.modules.get(args.patch_path)
+    module_obj = sys.modules.get(patch_path)
     if module_obj is not None:
         module_path_attr = getattr(module_obj, "__file__", None)
         if module_path_attr is not None:
@@ -120,8 +127,8 @@ def main() -> None:
     # Create engine
     engine = ObliqueEngine(
         patch=patch,
-        width=args.width,
-        height=args.height,
+        width=width,
+        height=height,
         target_fps=args.fps,
         hot_reload_shaders=args.hot_reload_shaders,
         monitor=args.monitor,
@@ -131,7 +138,7 @@ def main() -> None:
 
     # Send initial status to TUI
     bridge.send_status({
-        "patch": args.patch_path,
+        "patch": patch_path,
         "shaders": args.hot_reload_shaders,
         "python": args.hot_reload_python,
     })
@@ -140,6 +147,8 @@ def main() -> None:
     bridge.send_params_snapshot()
 
     # -- File watchers --------------------------------------------------------
+    # Set by the file watcher thread or a TUI request, consumed by the render loop
+    reload_event = threading.Event()
     python_watcher_stop = threading.Event()
     python_watcher_thread = None
 
@@ -159,22 +168,22 @@ def main() -> None:
                 if current_mtime <= last_mtime:
                     continue
                 last_mtime = current_mtime
-                reload_state["requested"] = True
+                reload_event.set()
                 info("Patch file change detected; reload queued")
 
         python_watcher_thread = threading.Thread(target=watch_python_patch, daemon=True)
         python_watcher_thread.start()
 
-    reload_state = {"requested": False}
     _render_error_sent = False
 
     # -- Main render loop -----------------------------------------------------
     try:
         engine._create_window()
-        engine.start_time = time.time()
+        warm_up_patch(engine.patch, engine.ctx)
+        engine.start_time = time.perf_counter()
         engine.running = True
 
-        info(f"Starting Oblique live mode with patch {args.patch_path}")
+        info(f"Starting Oblique live mode with patch {patch_path}")
 
         if engine.audio_output is not None:
             engine.audio_output.start()
@@ -187,7 +196,17 @@ def main() -> None:
 
         import glfw
 
-        while not glfw.window_should_close(engine.window):
+        # Bind the per-frame engine state to locals; only the patch changes
+        # (on reload) while the loop runs
+        window = engine.window
+        pm = engine.performance_monitor
+        start_time = engine.start_time
+        frame_duration = engine.frame_duration
+        patch = engine.patch
+
+        next_deadline = time.perf_counter() + frame_duration
+        should_close = functools.partial(glfw.window_should_close, window)
+        while not should_close():
             # Poll IPC from TUI — graceful degradation if TUI dies
             if not _tui_dead and tui_process.poll() is not None:
                 _tui_dead = True
@@ -200,17 +219,20 @@ def main() -> None:
                 if signal == "quit":
                     break
             if signal == "reload":
-                reload_state["requested"] = True
+                reload_event.set()
 
             # Handle reload
-            if reload_state["requested"]:
-                reload_state["requested"] = False
+            if reload_event.is_set():
+                reload_event.clear()
                 try:
-                    module = importlib.import_module(args.patch_path)
-                    importlib.reload(module)
-                    engine.patch = _load_patch(
-                        args.patch_path, args.patch_function, args.width, args.height
+                    # Drop the finders' cached directory listings so files saved
+                    # since the last import (e.g. a new helper module) are found
+                    importlib.invalidate_caches()
+                    new_patch = _load_patch(
+                        patch_path, patch_function, width, height, reload=True
                     )
+                    warm_up_patch(new_patch, engine.ctx, time.perf_counter() - start_time)
+                    engine.patch = patch = new_patch
                     info("Patch reloaded successfully")
                     bridge.send_params_snapshot()
                     _render_error_sent = False
@@ -218,44 +240,40 @@ def main() -> None:
                     error(f"Failed to reload patch: {e}")
 
             # Performance monitoring
-            if engine.performance_monitor:
-                engine.performance_monitor.begin_frame()
+            if pm:
+                pm.begin_frame()
 
-            frame_start = time.time()
-            t = frame_start - engine.start_time
+            t = time.perf_counter() - start_time
 
             # Poll MIDI
             midi_mapper.poll()
 
             # Render — catch tick callback errors so the loop survives
             try:
-                engine._render_patch(t, engine.patch)
+                engine._render_patch(t, patch, next_deadline)
             except Exception as e:
                 # Throttle error logging to avoid flooding the TUI
                 if not _render_error_sent:
                     error(f"Render error (patch will keep retrying): {e}")
                     _render_error_sent = True
                 # Swap buffers so the window stays responsive
-                glfw.swap_buffers(engine.window)
+                glfw.swap_buffers(window)
                 glfw.poll_events()
-                time.sleep(engine.frame_duration)
+                time.sleep(frame_duration)
+                next_deadline = time.perf_counter() + frame_duration
                 continue
 
             _render_error_sent = False
 
             # Performance monitoring + telemetry
-            if engine.performance_monitor:
-                engine.performance_monitor.end_frame()
+            if pm:
+                pm.end_frame()
 
             stats = engine.get_performance_stats() or {}
-            stats["memory"] = engine.performance_monitor.get_memory_usage_mb()
+            stats["memory"] = pm.get_memory_usage_mb()
             bridge.send_telemetry(stats)
 
-            # Frame rate limiting
-            elapsed = time.time() - frame_start
-            sleep_time = engine.frame_duration - elapsed
-            if sleep_time > 0:
-                time.sleep(sleep_time)
+            next_deadline = next_frame_deadline(next_deadline, frame_duration)
 
     except Exception as e:
         error(f"Error in Oblique live engine: {e}")
@@ -4,7 +4,6 @@ BrokenCirclesModule: Generates 5 concentric circles, each responding to a differ
 from dataclasses import dataclass, field
 from typing import List, Tuple
 
-from core.logger import debug
 from core.registry import oblique_module
 from modules.core.base_av_module import BaseAVModule, BaseAVParams, Uniforms
 from processing.base_processing_operator import BaseProcessingOperator
@@ -1,9 +1,7 @@
 from dataclasses import dataclass, field
 
-from processing.fft_bands import FFTBands
-
 from core.registry import oblique_module
-from modules.core.base_av_module import BaseAVModule, BaseAVParams, ParamFloat, ParamFloatList, ParamInt, Uniforms
+from modules.core.base_av_module import BaseAVModule, BaseAVParams, ParamFloat, ParamFloatList, Uniforms
 
 
 @dataclass
@@ -1,9 +1,5 @@
 from dataclasses import dataclass
 
-from dataclasses import dataclass
-
-import moderngl
-
 from core.registry import oblique_module
 from modules.core.base_av_module import (
     BaseAVModule,
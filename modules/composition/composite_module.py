@@ -1,6 +1,5 @@
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Tuple
 
 import moderngl
 
@@ -95,6 +94,7 @@ class CompositeModule(BaseAVModule[CompositeParams, CompositeUniforms]):
         "parameters": CompositeParams.__annotations__,
     }
     frag_shader_path: str = "modules/composition/shaders/composite.frag"
+    texture_dtype: str = "f2"
 
     def __init__(self, params: CompositeParams):
         super().__init__(params)
@@ -24,7 +24,7 @@ from typing import (
 
 import moderngl
 
-from core.renderer import release_texture_reference, render_to_texture
+from core.renderer import precompile_shader, release_texture_reference, render_to_texture
 from processing.base_processing_operator import BaseProcessingOperator
 
 # Dynamic parameter types - can be static values or computed at runtime
@@ -39,6 +39,9 @@ ParamFloatList = Union[list[float], Callable[[], list[float]], BaseProcessingOpe
 ParamBoolList = Union[list[bool], Callable[[], list[bool]], BaseProcessingOperator[list[bool]]]
 ParamStrList = Union[list[str], Callable[[], list[str]], BaseProcessingOperator[list[str]]]
 
+# Exact types of static parameter values, resolved without the operator/callable checks
+_STATIC_PARAM_TYPES = frozenset({int, float, bool, str, list, tuple})
+
 # Texture params
 ParamTexture = Union[moderngl.Texture, Callable[[], moderngl.Texture], "BaseAVModule"]
 ParamTextureList = Union[
@@ -92,6 +95,11 @@ class TexturePass:
         Controls whether this pass receives uniforms inherited from its parent pass/module.
         When ``False``, only this pass's explicit ``uniforms`` values and ``u_resolution``
         are provided.
+    dtype:
+        Component type of the pass's render target: ``"f4"`` (32-bit float),
+        ``"f2"`` (half float) or ``"f1"`` (8-bit normalised). Half float halves the
+        bandwidth of the target at reduced precision; readers of the texture
+        (e.g. the headless renderer) must widen it back to float32.
     """
 
     frag_shader_path: str
@@ -106,6 +114,7 @@ class TexturePass:
     previous_uniform_name: str = "u_previous"
     filter: int | None = None
     inherit_parent_uniforms: bool = True
+    dtype: str = "f4"
 
 
 
@@ -152,6 +161,7 @@ class BaseAVModule(ABC, Generic[P, U]):
     frag_shader_path: str  # Must be set by subclass
     ping_pong: bool = False
     previous_uniform_name: str = "u_previous_frame"
+    texture_dtype: str = "f4"  # Render target component type of the main pass
 
     def __init__(self, params: P):
         """
@@ -167,6 +177,8 @@ class BaseAVModule(ABC, Generic[P, U]):
                 f"{self.__class__.__name__} must define a class attribute 'frag_shader_path' (str)!"
             )
         self.params = params
+        # Key prefix for this module's cached render targets; fixed for the module's lifetime
+        self._owner_tag = f"{self.__class__.__name__}:{id(self)}"
 
         # Sane defaults for development: a single main pass with the module's shader
         self.texture_pass: TexturePass = TexturePass(
@@ -174,7 +186,8 @@ class BaseAVModule(ABC, Generic[P, U]):
             uniforms={},
             ping_pong=self.ping_pong,
             previous_uniform_name=self.previous_uniform_name,
-            name=f"{self.__class__.__name__}:{id(self)}",
+            name=self._owner_tag,
+            dtype=self.texture_dtype,
         )
 
         # Internal frame counter and per-pass history for ping-pong
@@ -230,41 +243,39 @@ class BaseAVModule(ABC, Generic[P, U]):
            previous texture is injected under ``previous_uniform_name`` if available.
         """
         # Ask the subclass for initial uniforms
-        initial_uniforms = dict(self.prepare_uniforms(t))
+        initial_uniforms = self.prepare_uniforms(t)
 
-        # Resolve BaseAVModule (or list thereof) to textures and separate base uniforms in a single loop
-        base_uniforms: dict[str, Any] = {}
-        for key, value in list(initial_uniforms.items()):
+        # Resolve BaseAVModule (or list thereof) to textures and collect the base uniforms
+        # straight into the final mapping; TexturePass entries are rendered below.
+        final_uniforms: dict[str, Any] = {}
+        pending_passes: list[tuple[str, TexturePass]] = []
+        for key, value in initial_uniforms.items():
             # Resolve BaseAVModule or list[BaseAVModule] to texture(s)
             if isinstance(value, BaseAVModule) or (isinstance(value, list) and all(isinstance(v, BaseAVModule) for v in value)):
                 value = self._resolve_texture_param(value, ctx, width, height, t, filter)
-                initial_uniforms[key] = value  # update in-place for later use
 
-            # Only include non-TexturePass in base_uniforms
-            if not isinstance(value, TexturePass):
-                base_uniforms[key] = value
+            if isinstance(value, TexturePass):
+                pending_passes.append((key, value))
+            else:
+                final_uniforms[key] = value
 
         # Per-call caches/state
         processed: dict[str, moderngl.Texture] = {}
-        owner_tag = f"{self.__class__.__name__}:{id(self)}"
+        owner_tag = self._owner_tag
 
         # Render every TexturePass referenced in the initial uniforms to get final uniforms
-        final_uniforms = dict(base_uniforms)
-        for uniform_name, value in initial_uniforms.items():
-            if isinstance(value, TexturePass):
-                final_uniforms[uniform_name] = self._render_texture_pass(
-                    pass_obj=value,
-                    ctx=ctx,
-                    parent_width=width,
-                    parent_height=height,
-                    t=t,
-                    texture_filter=filter,
-                    inherited_uniforms=final_uniforms,
-                    processed=processed,
-                    owner_tag=owner_tag,
-                )
-            else:
-                final_uniforms[uniform_name] = value
+        for uniform_name, pass_obj in pending_passes:
+            final_uniforms[uniform_name] = self._render_texture_pass(
+                pass_obj=pass_obj,
+                ctx=ctx,
+                parent_width=width,
+                parent_height=height,
+                t=t,
+                texture_filter=filter,
+                inherited_uniforms=final_uniforms,
+                processed=processed,
+                owner_tag=owner_tag,
+            )
 
         # Ensure the main/root pass gets its own resolution
         final_uniforms.setdefault("u_resolution", (width, height))
@@ -287,6 +298,38 @@ class BaseAVModule(ABC, Generic[P, U]):
 
         return root_tex
 
+    def warmup(self, ctx: moderngl.Context) -> None:
+        """
+        Compile the shaders this module and its upstream graph render with.
+
+        Walks the module's passes (the main pass and any TexturePass attributes), the
+        passes and modules they reference, and the BaseAVModule inputs found in
+        ``params``, compiling each fragment shader once so the first rendered frame
+        doesn't stall on GLSL compilation. Passes that are only created inside
+        ``prepare_uniforms`` are still compiled on first use.
+
+        Args:
+            ctx (moderngl.Context): Context the shaders will be rendered with.
+        """
+        seen: set[int] = set()
+        pending: list[Any] = [self]
+        while pending:
+            node = pending.pop()
+            if id(node) in seen:
+                continue
+            seen.add(id(node))
+
+            if isinstance(node, TexturePass):
+                precompile_shader(ctx, node.frag_shader_path)
+                pending.extend((node.uniforms or {}).values())
+            elif isinstance(node, BaseAVModule):
+                for owner in (node, *type(node).__mro__):
+                    pending.extend(v for v in vars(owner).values() if isinstance(v, TexturePass))
+                if dataclasses.is_dataclass(node.params):
+                    pending.extend(getattr(node.params, f.name) for f in dataclasses.fields(node.params))
+            elif isinstance(node, (list, tuple)):
+                pending.extend(node)
+
     def _render_texture_pass(
         self,
         pass_obj: TexturePass,
@@ -314,9 +357,7 @@ class BaseAVModule(ABC, Generic[P, U]):
         pass_filter = pass_obj.filter if pass_obj.filter is not None else texture_filter
 
         # Build uniforms for this pass from inherited values (opt-in per pass).
-        uniforms: dict[str, Any] = {}
-        if pass_obj.inherit_parent_uniforms:
-            uniforms.update(inherited_uniforms)
+        uniforms: dict[str, Any] = dict(inherited_uniforms) if pass_obj.inherit_parent_uniforms else {}
         uniforms["u_resolution"] = (pass_width, pass_height)
 
         # Resolve explicit texture inputs / dependencies declared on the pass
@@ -354,7 +395,7 @@ class BaseAVModule(ABC, Generic[P, U]):
             prev_tex = self._texture_history.get(prev_key)
             if prev_tex is None:
                 # Sane default: provide a zero-initialized texture as previous
-                prev_tex = ctx.texture((pass_width, pass_height), 4, dtype="f4", alignment=1)
+                prev_tex = ctx.texture((pass_width, pass_height), 4, dtype=pass_obj.dtype, alignment=1)
                 prev_tex.filter = (pass_filter, pass_filter)
                 prev_tex.repeat_x = False
                 prev_tex.repeat_y = False
@@ -370,6 +411,7 @@ class BaseAVModule(ABC, Generic[P, U]):
             cast(Uniforms, uniforms),
             pass_filter,
             cache_tag=cache_tag,
+            dtype=pass_obj.dtype,
         )
 
         # Update memo and ping-pong history
@@ -440,9 +482,13 @@ class BaseAVModule(ABC, Generic[P, U]):
 
     def _resolve_param(self, param: ParamInt | ParamFloat | ParamBool | ParamStr | ParamIntList | ParamFloatList |
         ParamBoolList | ParamStrList) -> int | float | bool | str | list[int] | list[float] | list[bool] | list[str]:
+        # Most params are constants; an exact-type set lookup is far cheaper than
+        # the ABC isinstance checks below, which run for every param every frame
+        if type(param) in _STATIC_PARAM_TYPES:
+            return param
         if isinstance(param, BaseProcessingOperator):
             return param.process()
-        elif isinstance(param, Callable):
+        elif callable(param):
             return param()
         else:
             return param
@@ -457,7 +503,7 @@ class BaseAVModule(ABC, Generic[P, U]):
 
     def _resolve_texture_param(self, param: ParamTexture | ParamTextureList, ctx: moderngl.Context, width: int,
         height: int, t: float, filter: int) -> moderngl.Texture | list[moderngl.Texture]:
-        if isinstance(param, Callable):
+        if callable(param):
             return param()
         elif isinstance(param, BaseAVModule):
             return param.render_texture(ctx, width, height, t, filter)
@@ -2,9 +2,8 @@ from dataclasses import dataclass, field
 from typing import Literal
 
 from core.registry import oblique_module
-from processing.base_processing_operator import BaseProcessingOperator
 
-from .base_av_module import BaseAVModule, BaseAVParams, ParamFloat, ParamInt, Uniforms
+from .base_av_module import BaseAVModule, BaseAVParams, ParamFloat, Uniforms
 
 
 @dataclass
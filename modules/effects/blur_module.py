@@ -59,6 +59,7 @@ class BlurModule(BaseAVModule[BlurParams, BlurUniforms]):
         "parameters": BlurParams.__annotations__,
     }
     frag_shader_path: str = "modules/effects/shaders/blur-module.frag"
+    texture_dtype: str = "f2"
 
     def __init__(self, params: BlurParams):
         super().__init__(params)
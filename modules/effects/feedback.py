@@ -60,6 +60,7 @@ class FeedbackModule(BaseAVModule[FeedbackParams, FeedbackUniforms]):
     }
     frag_shader_path: str = "modules/effects/shaders/feedback.frag"
     ping_pong: bool = True
+    texture_dtype: str = "f2"
     previous_uniform_name: str = "u_feedback_texture"
 
     def __init__(self, params: FeedbackParams):
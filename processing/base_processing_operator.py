@@ -7,6 +7,10 @@ class BaseProcessingOperator(ABC, Generic[T]):
     """
     Abstract base class for all processing operators in Oblique.
     Defines the interface for feature extraction, normalization, and event detection modules.
+
+    Operators that cache their result per audio chunk key the cache on the identity of
+    the array returned by ``peek()``: inputs hand out the same object until a new chunk
+    arrives, so an ``is`` check detects new audio without comparing samples.
     """
 
     def __init__(self) -> None:
@@ -0,0 +1,37 @@
+from typing import Optional
+
+import numpy as np
+
+
+def to_mono(data: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Downmix a ``(frames, channels)`` audio chunk to mono.
+
+    1-D input is returned unchanged. Multi-channel input is averaged into ``out``
+    (a float32 buffer) which is reused when its length matches the chunk, so
+    callers can keep the returned array and pass it back on the next frame. Only
+    keep it when it is not the input itself, or a later multi-channel chunk would
+    be written into the caller's audio:
+
+        mono = to_mono(data, self._mono_buf)
+        if mono is not data:
+            self._mono_buf = mono
+
+    :param data: Audio chunk, mono ``(frames,)`` or interleaved ``(frames, channels)``.
+    :param out: Optional float32 scratch buffer from a previous call.
+    :return: Mono signal; aliases ``out`` for multi-channel input.
+    """
+    if data.ndim != 2:
+        return data
+
+    frames, channels = data.shape
+    if out is None or out.shape[0] != frames:
+        out = np.empty(frames, dtype=np.float32)
+
+    if channels == 2:
+        np.add(data[:, 0], data[:, 1], out=out)
+        out *= 0.5
+    else:
+        np.sum(data, axis=1, out=out)
+        out *= 1.0 / channels
+    return out
@@ -23,9 +23,19 @@ class Envelope(BaseProcessingOperator[float]):
         self.decay = decay
         self.value = 0.0
 
+    @property
+    def decay(self) -> float:
+        return self._decay
+
+    @decay.setter
+    def decay(self, decay: float) -> None:
+        # Keep the retention coefficient in step so process() doesn't recompute it each tick
+        self._decay = decay
+        self._retain = 1.0 - decay
+
     def process(self) -> float:
         x = self.input_fn()
-        self.value = self.decay * x + (1 - self.decay) * self.value
+        self.value = self._decay * x + self._retain * self.value
         return self.value
 
 
@@ -1,11 +1,11 @@
-from typing import Any, List, Sequence
+from typing import Any, List, Optional
 
 import numpy as np
 from typing_extensions import Dict
 
-from core.logger import debug
 from inputs.audio.core.base_audio_input import BaseAudioInput
 from processing.base_processing_operator import BaseProcessingOperator
+from processing.downmix import to_mono
 
 
 class FFTBands(BaseProcessingOperator[List[float]]):
@@ -71,15 +71,33 @@ class FFTBands(BaseProcessingOperator[List[float]]):
                 band_bins = np.array([closest_idx])
             self.band_bins.append(band_bins)
 
+        # Each band is a contiguous run of bins, so its mean is a difference of
+        # prefix sums; one cumsum replaces a Python loop of fancy-indexed means
+        self._band_starts = np.array([b[0] for b in self.band_bins])
+        self._band_ends = np.array([b[-1] + 1 for b in self.band_bins])
+        self._band_sizes = self._band_ends - self._band_starts
+        self._prefix = np.zeros(n_fft // 2 + 2)
+
         # dB scale parameters - much more conservative for electronic music
         self.db_floor = -60.0  # silence → 0.0 (much lower floor)
         self.db_ceil  = 60.0   # full‑scale sine → 1.0 (much lower ceiling)
         self.scale = 1.0 / (self.db_ceil - self.db_floor)
 
-        # rolling buffer so caller can feed smaller chunks
+        # right-aligned shift buffer: newest samples at the end, the unfilled
+        # head stays zero so the FFT can run before n_fft samples have arrived
         self._ring = np.zeros(n_fft, dtype=np.float32)
-        self._write_pos = 0
-        self._samples_accumulated = 0  # Track how many samples we've accumulated
+        self._mono_buf: Optional[np.ndarray] = None
+
+        # Scratch buffers for the windowed frame, its spectrum and magnitudes,
+        # reused every call so the analysis path doesn't allocate per frame
+        self._windowed = np.empty(n_fft, dtype=np.float32)
+        self._spectrum = np.empty(n_fft // 2 + 1, dtype=np.complex64)
+        self._mag = np.empty(n_fft // 2 + 1, dtype=np.float32)
+
+        # Last chunk pushed and the band levels analysed from it; inputs return the
+        # same array until they advance, so the FFT runs once per chunk
+        self._last_chunk: Optional[np.ndarray] = None
+        self._bands = np.zeros(num_bands)
 
         # Smoothing parameters
         self._smoothed_bands = None  # Will store the smoothed values
@@ -88,72 +106,73 @@ class FFTBands(BaseProcessingOperator[List[float]]):
     # -------------------------------------------------------------
 
     def _push_samples(self, chunk: np.ndarray) -> None:
-        """Append mono samples into the ring buffer."""
-        if chunk.ndim == 2:
-            chunk = chunk.mean(axis=1)
+        """Shift mono samples into the right-aligned analysis buffer."""
+        mono = to_mono(chunk, self._mono_buf)
+        if mono is not chunk:
+            self._mono_buf = mono
+        # Keep the window multiply and FFT on the single-precision path
+        chunk = np.asarray(mono, dtype=np.float32)
 
         n = len(chunk)
         if n == 0:
             return
 
-        # Handle the case where chunk is larger than ring buffer
+        # Chunk covers the whole window: keep only the last n_fft samples
         if n >= self.n_fft:
-            # Keep only the last n_fft samples
-            chunk = chunk[-self.n_fft:]
-            n = self.n_fft
+            self._ring[:] = chunk[-self.n_fft:]
+            return
+
+        # Slide the previous samples left by one hop and append the new ones
+        self._ring[:-n] = self._ring[n:]
+        self._ring[-n:] = chunk
+
+    def _analyse(self) -> np.ndarray:
+        """Band levels in [0..1] of the current analysis window."""
+        # windowed FFT into the preallocated buffers
+        np.multiply(self._ring, self.window, out=self._windowed)
+        np.fft.rfft(self._windowed, out=self._spectrum)
+        mag = np.abs(self._spectrum, out=self._mag)
 
-        # Write to ring buffer
-        for i in range(n):
-            pos = (self._write_pos + i) % self.n_fft
-            self._ring[pos] = chunk[i]
+        # average magnitude per band from prefix sums (float64 keeps the
+        # differences exact enough over a few thousand bins)
+        prefix = self._prefix
+        np.cumsum(mag, out=prefix[1:])
+        bands = (prefix[self._band_ends] - prefix[self._band_starts]) / self._band_sizes
 
-        self._write_pos = (self._write_pos + n) % self.n_fft
-        self._samples_accumulated = min(self._samples_accumulated + n, self.n_fft)
+        # convert to dB (avoid log(0))
+        bands = 20 * np.log10(np.maximum(bands, 1e-9))
+
+        # map dB range to 0..1
+        bands = (bands - self.db_floor) * self.scale
+        return np.clip(bands, 0.0, 1.0)
 
     def process(self) -> List[float]:
         """
         Feed a new audio chunk and get `n_bands` floats in [0..1].
 
-        Returns 0‑filled bands until the internal buffer holds `n_fft` samples.
+        The FFT runs over the most recent `n_fft` samples whenever the input yields
+        a new chunk; until that many have arrived the oldest part of the window is
+        zero-padded. Repeated calls on the same chunk only advance the smoothing.
         """
         chunk = self.audio_input.peek(n_buffers=1)
         if chunk is None:
             # debug("FFT: No audio chunk available")
             return [0.0] * self.n_bands
 
-        self._push_samples(chunk)
-
-        # Check if we have enough samples for a full FFT
-        if self._samples_accumulated < self.n_fft:
-            debug(f"FFT: Not enough samples ({self._samples_accumulated}/{self.n_fft})")
-            return [0.0] * self.n_bands
-
-        # windowed FFT
-        spectrum = np.fft.rfft(self._ring * self.window)
-        mag = np.abs(spectrum)
-
-        # average magnitude per band
-        bands = []
-        for b in self.band_bins:
-            if b.size > 0:
-                band_mag = mag[b].mean()
-            else:  # pragma: no cover - band bins precomputed to be non-empty
-                band_mag = 0.0
-            bands.append(band_mag)
-
-        # convert to dB (avoid log(0))
-        bands = 20 * np.log10(np.maximum(bands, 1e-9))
-
-        # map dB range to 0..1
-        bands = (bands - self.db_floor) * self.scale
-        result = np.clip(bands, 0.0, 1.0)
+        if chunk is not self._last_chunk:
+            self._last_chunk = chunk
+            self._push_samples(chunk)
+            self._bands = self._analyse()
+        result = self._bands
 
         # Apply smoothing
         if self._smoothed_bands is None:
             self._smoothed_bands = result.copy()
         else:
-            # Exponential moving average: new = alpha * current + (1-alpha) * previous
-            self._smoothed_bands = (self._smoothing_factor * result +
-                                   (1.0 - self._smoothing_factor) * self._smoothed_bands)
+            # Exponential moving average: new = alpha * current + (1-alpha) * previous,
+            # updated in place on the smoothed array
+            smoothed = self._smoothed_bands
+            smoothed *= 1.0 - self._smoothing_factor
+            smoothed += self._smoothing_factor * result
 
         return self._smoothed_bands.tolist()
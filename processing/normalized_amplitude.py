@@ -1,12 +1,15 @@
 
+import math
+
 import numpy as np
 from enum import Enum, auto
-from typing import Optional
+from typing import Callable, Dict, List, Optional, Sequence
 
 from core.paths import resolve_asset_path
 from inputs.audio.core.base_audio_input import BaseAudioInput
 
 from .base_processing_operator import BaseProcessingOperator
+from .downmix import to_mono
 
 
 class CurveType(Enum):
@@ -16,6 +19,54 @@ class CurveType(Enum):
     SIGMOID = auto()
 
 
+def _apply_curve(normalized, curve: CurveType):
+    """
+    Apply an optional non-linear mapping to normalized amplitude(s) in [0, 1].
+    Works on scalars and arrays alike.
+    """
+    if curve == CurveType.SQRT:
+        return np.sqrt(normalized)
+    if curve == CurveType.LOG:
+        return np.log1p(9 * normalized) / np.log1p(9)  # log curve, 0-1
+    if curve == CurveType.SIGMOID:
+        return 1 / (1 + np.exp(-8 * (normalized - 0.5)))  # sigmoid centered at 0.5
+    return normalized
+
+
+_LOG1P_9 = math.log1p(9)
+
+
+def _linear_curve(normalized: float) -> float:
+    return normalized
+
+
+def _sqrt_curve(normalized: float) -> float:
+    return math.sqrt(normalized)
+
+
+def _log_curve(normalized: float) -> float:
+    return math.log1p(9 * normalized) / _LOG1P_9
+
+
+def _sigmoid_curve(normalized: float) -> float:
+    return 1 / (1 + math.exp(-8 * (normalized - 0.5)))
+
+
+# Scalar counterparts of _apply_curve using ``math``, for the once-per-chunk path
+# where NumPy's ufunc dispatch on a Python float costs more than the maths
+_SCALAR_CURVES: Dict[CurveType, Callable[[float], float]] = {
+    CurveType.NONE: _linear_curve,
+    CurveType.SQRT: _sqrt_curve,
+    CurveType.LOG: _log_curve,
+    CurveType.SIGMOID: _sigmoid_curve,
+}
+
+
+def _apply_curve_scalar(normalized: float, curve: CurveType) -> float:
+    """Apply ``curve`` to a single normalized amplitude with scalar ``math``."""
+    return _SCALAR_CURVES[curve](normalized)
+
+
 class NormalizedAmplitudeOperator(BaseProcessingOperator[float]):
     """
     Computes the normalized amplitude (RMS) of an audio chunk.
@@ -37,7 +88,12 @@ class NormalizedAmplitudeOperator(BaseProcessingOperator[float]):
         super().__init__()
         self.amplitude = 0.0
         self.audio_input = audio_input
+        self._mono_buf: Optional[np.ndarray] = None
         self.curve = curve
+        # Last chunk seen and its value, so several consumers reading this
+        # operator within one frame don't recompute the same chunk
+        self._last_data: Optional[np.ndarray] = None
+        self._last_value = 0.0
 
     def process(self) -> float:
         """
@@ -52,25 +108,145 @@ class NormalizedAmplitudeOperator(BaseProcessingOperator[float]):
             raise ValueError("Input data must be a numpy ndarray.")
         if data.size == 0:
             return 0.0
+        if data is self._last_data:
+            return self._last_value
+        self._last_data = data
+        self._last_value = self._normalized_amplitude(data)
+        return self._last_value
+
+    def _normalized_amplitude(self, data: np.ndarray) -> float:
         # Flatten to mono if multi-channel
-        if data.ndim == 2:
-            mono = data.mean(axis=1)
-        else:
-            mono = data
-        rms = np.sqrt(np.mean(np.square(mono)))
+        mono = to_mono(data, self._mono_buf)
+        if mono is not data:
+            self._mono_buf = mono
+        mono = mono.astype(np.float32, copy=False)
+        # Sum of squares as one BLAS dot (no squared temporary); the rest is scalar math
+        rms = math.sqrt(float(np.dot(mono, mono)) / len(mono))
         if rms < 1e-10:
             return 0.0
-        dbfs = 20 * np.log10(rms)
+        dbfs = 20 * math.log10(rms)
+        # Map -60 dBFS (quiet) to 0, 0 dBFS (max) to 1
+        normalized = min(max((dbfs + 60) / 60, 0.0), 1.0)
+        # Optional non-linear mapping, bound when the curve was set
+        return self._curve_fn(normalized)
+
+    @property
+    def curve(self) -> CurveType:
+        return self._curve
+
+    @curve.setter
+    def curve(self, curve: CurveType) -> None:
+        # Resolve the curve once here so process() makes a single call, no enum compares
+        curve_fn = _SCALAR_CURVES.get(curve)
+        if curve_fn is None:
+            raise ValueError(f"Unknown curve type: {curve!r}")
+        self._curve = curve
+        self._curve_fn = curve_fn
+
+
+class BatchedAmplitudeOperator(BaseProcessingOperator[List[float]]):
+    """
+    Normalized amplitude of several channels of one multi-channel input, computed together.
+
+    Peeks the selected channels once and maps every channel's RMS to [0, 1] with the
+    same dBFS scaling as :class:`NormalizedAmplitudeOperator`, in a single vectorised
+    pass. Index the operator to get a per-channel float operator:
+
+        amps = BatchedAmplitudeOperator(device, [2, 3, 4])
+        kick = Envelope(amps[0].process, decay=0.1)
+    """
+
+    metadata = {
+        "name": "BatchedAmplitudeOperator",
+        "description": "Outputs the normalized amplitude (RMS) of several channels of an audio input.",
+        "parameters": {},
+    }
+
+    def __init__(
+        self,
+        audio_input: BaseAudioInput,
+        channels: Sequence[int],
+        curves: Optional[Sequence[CurveType]] = None,
+    ):
+        """
+        :param audio_input: Multi-channel BaseAudioInput (e.g. an AudioDeviceInput)
+        :param channels: Channel indices to measure, one output value per channel
+        :param curves: Optional per-channel non-linear mapping; defaults to CurveType.NONE
+        """
+        super().__init__()
+        self.audio_input = audio_input
+        self.channels = [int(ch) for ch in channels]
+        self.curves = list(curves) if curves is not None else [CurveType.NONE] * len(self.channels)
+        if len(self.curves) != len(self.channels):
+            raise ValueError(f"Expected {len(self.channels)} curves, got {len(self.curves)}.")
+        # Channel positions per non-linear curve, so each curve runs once over its group
+        self._curve_groups = {
+            curve: np.array([i for i, c in enumerate(self.curves) if c == curve])
+            for curve in set(self.curves)
+            if curve != CurveType.NONE
+        }
+        self._zeros = np.zeros(len(self.channels))
+        self._values = self._zeros
+        self._last_data: Optional[np.ndarray] = None
+
+    def __getitem__(self, index: int) -> "BatchedAmplitudeChannel":
+        return BatchedAmplitudeChannel(self, index)
+
+    def __len__(self) -> int:
+        return len(self.channels)
+
+    def process(self) -> List[float]:
+        """
+        :return: Normalized amplitude in [0, 1] for each selected channel.
+        """
+        return self.values().tolist()
+
+    def values(self) -> np.ndarray:
+        """
+        Return the per-channel amplitudes as an array, recomputed only when the input
+        yields a different chunk.
+        """
+        data = self.audio_input.peek(channels=self.channels)
+        if data is None or not isinstance(data, np.ndarray) or data.size == 0:
+            return self._zeros
+        if data is self._last_data:
+            return self._values
+
+        frames = data.reshape(len(data), -1)
+        if frames.shape[1] != len(self.channels):
+            # Curves are grouped by column position, so a dropped channel would shift them
+            raise ValueError(
+                f"Expected {len(self.channels)} channels from the audio input, got {frames.shape[1]}."
+            )
+        rms = np.sqrt(np.einsum("ij,ij->j", frames, frames) / len(frames))
+        with np.errstate(divide="ignore"):
+            dbfs = 20 * np.log10(rms)
         # Map -60 dBFS (quiet) to 0, 0 dBFS (max) to 1
         normalized = np.clip((dbfs + 60) / 60, 0.0, 1.0)
-        # Optional non-linear mapping
-        if self.curve == CurveType.SQRT:
-            normalized = np.sqrt(normalized)
-        elif self.curve == CurveType.LOG:
-            normalized = np.log1p(9 * normalized) / np.log1p(9)  # log curve, 0-1
-        elif self.curve == CurveType.SIGMOID:
-            normalized = 1 / (1 + np.exp(-8 * (normalized - 0.5)))  # sigmoid centered at 0.5
-        return float(normalized)
+        for curve, idx in self._curve_groups.items():
+            normalized[idx] = _apply_curve(normalized[idx], curve)
+        normalized[rms < 1e-10] = 0.0
+
+        self._last_data = data
+        self._values = normalized
+        return normalized
+
+
+class BatchedAmplitudeChannel(BaseProcessingOperator[float]):
+    """
+    Single-channel view of a :class:`BatchedAmplitudeOperator`.
+    """
+
+    def __init__(self, batch: BatchedAmplitudeOperator, index: int):
+        super().__init__()
+        self.batch = batch
+        self.index = index
+
+    def process(self) -> float:
+        """
+        :return: Normalized amplitude in [0, 1] of this channel.
+        """
+        return float(self.batch.values()[self.index])
 
 
 if __name__ == "__main__":  # pragma: no cover
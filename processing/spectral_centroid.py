@@ -1,10 +1,52 @@
+import math
 from typing import Any, Dict
 
 import numpy as np
 
-from core.paths import resolve_asset_path
 from inputs.audio.core.base_audio_input import BaseAudioInput
 from processing.base_processing_operator import BaseProcessingOperator
+from processing.frame_spectrum import shared_spectrum
+
+
+def _humanize_centroid(norm_centroid: float) -> float:
+    """
+    Map a centroid normalised by the "bright" threshold onto [0, 1] for techno music.
+
+    Emphasises the musically relevant range:
+    - 0-2kHz (bass/kick range): maps to 0-0.3
+    - 2-4kHz (mid range): maps to 0.3-0.6
+    - 4-8kHz (bright range): maps to 0.6-1.0
+    - >8kHz: saturates towards 1.0
+
+    Works on plain Python floats so the per-frame call avoids NumPy scalar dispatch.
+    """
+    if norm_centroid <= 0.25:  # 0-2kHz range
+        humanized = norm_centroid * 1.2  # Gentle slope for bass
+    elif norm_centroid <= 0.5:  # 2-4kHz range
+        humanized = 0.3 + (norm_centroid - 0.25) * 1.2  # Steeper for mids
+    elif norm_centroid <= 1.0:  # 4-8kHz range
+        humanized = 0.6 + (norm_centroid - 0.5) * 0.8  # Steep for bright
+    else:  # >8kHz
+        humanized = 1.0 - math.exp(-(norm_centroid - 1.0) * 0.5)  # Saturate
+
+    # Ensure we stay in [0, 1] range
+    return min(max(humanized, 0.0), 1.0)
+
+
+def _humanize_centroids(norm_centroids: np.ndarray) -> np.ndarray:
+    """
+    Vectorised :func:`_humanize_centroid` for a batch of normalised centroids.
+
+    Evaluates the same piecewise curve with ``np.select`` so offline analysis of
+    many frames runs in a few array passes instead of one Python call per frame.
+    """
+    x = np.asarray(norm_centroids, dtype=np.float64)
+    humanized = np.select(
+        [x <= 0.25, x <= 0.5, x <= 1.0],
+        [x * 1.2, 0.3 + (x - 0.25) * 1.2, 0.6 + (x - 0.5) * 0.8],
+        default=1.0 - np.exp(-(x - 1.0) * 0.5),
+    )
+    return np.clip(humanized, 0.0, 1.0, out=humanized)
 
 
 class SpectralCentroid(BaseProcessingOperator[float]):
@@ -22,62 +64,56 @@ class SpectralCentroid(BaseProcessingOperator[float]):
     def __init__(self, audio_input: BaseAudioInput):
         super().__init__()
         self.audio_input = audio_input
+        self.spectrum = shared_spectrum(audio_input)
         # Techno music typically has meaningful brightness content up to ~8kHz
         # We'll use this as our "bright" reference instead of Nyquist
         self.bright_freq_threshold = 8000.0  # Hz
         self.sample_rate = 44100.0
+        # Per chunk length, a (2, bins) matrix of [frequencies; ones] so a single
+        # matrix-vector product yields both the weighted sum and the total
+        self._weights_cache: Dict[int, np.ndarray] = {}
 
     def process(self) -> float:
-        data = self.audio_input.peek()
-        if data is None or not isinstance(data, np.ndarray) or data.size == 0:
+        spectrum = self.spectrum.get()
+        if spectrum is None:
             return 0.0
 
-        if data.ndim == 2:
-            mono = data.mean(axis=1)
-        else:
-            mono = data
-
-        spectrum = np.abs(np.fft.rfft(mono))
-        freqs = np.fft.rfftfreq(len(mono), d=1.0 / self.sample_rate)
-
-        # Calculate raw centroid
-        centroid = (
-            np.sum(freqs * spectrum) / np.sum(spectrum) if np.sum(spectrum) > 0 else 0.0
-        )
-
-        # Humanize the centroid for techno music:
-        # 1. Normalize by our "bright" threshold instead of Nyquist
-        # 2. Apply a non-linear curve that emphasizes the musically relevant range
-        # 3. Clamp to [0, 1] with a curve that makes "bright" techno closer to 1
+        # Calculate raw centroid: one BLAS call for sum(f * |X|) and sum(|X|)
+        weights = self._weights(self.spectrum.n_samples)
+        weighted, total = (weights @ spectrum).tolist()
+        centroid = weighted / total if total > 0 else 0.0
 
-        # Normalize by bright threshold (8kHz for techno)
-        norm_centroid = centroid / self.bright_freq_threshold
+        # Normalize by bright threshold (8kHz for techno) and humanize
+        return _humanize_centroid(centroid / self.bright_freq_threshold)
 
-        # Apply non-linear mapping to emphasize musically relevant brightness
-        # This curve makes:
-        # - 0-2kHz (bass/kick range): maps to 0-0.3
-        # - 2-4kHz (mid range): maps to 0.3-0.6
-        # - 4-8kHz (bright range): maps to 0.6-1.0
-        # - >8kHz: saturates towards 1.0
+    def process_spectra(self, spectra: np.ndarray, n_samples: int) -> np.ndarray:
+        """
+        Compute humanized centroids for a batch of magnitude spectra.
 
-        if norm_centroid <= 0.25:  # 0-2kHz range
-            humanized = norm_centroid * 1.2  # Gentle slope for bass
-        elif norm_centroid <= 0.5:  # 2-4kHz range
-            humanized = 0.3 + (norm_centroid - 0.25) * 1.2  # Steeper for mids
-        elif norm_centroid <= 1.0:  # 4-8kHz range
-            humanized = 0.6 + (norm_centroid - 0.5) * 0.8  # Steep for bright
-        else:  # >8kHz
-            humanized = 1.0 - np.exp(-(norm_centroid - 1.0) * 0.5)  # Saturate
+        Intended for offline analysis, e.g. over ``np.abs(np.fft.rfft(chunks, axis=1))``;
+        matches :meth:`process` frame by frame.
 
-        # Ensure we stay in [0, 1] range
-        humanized = np.clip(humanized, 0.0, 1.0)
+        :param spectra: Magnitudes of shape ``(frames, n_samples // 2 + 1)``.
+        :param n_samples: Length of the analysed chunks.
+        :return: Array of ``frames`` centroids in [0, 1].
+        """
+        weighted, total = self._weights(n_samples) @ np.asarray(spectra, dtype=np.float32).T
+        centroids = np.divide(weighted, total, out=np.zeros_like(weighted), where=total > 0)
+        return _humanize_centroids(centroids / self.bright_freq_threshold)
 
-        return float(humanized)
+    def _weights(self, n_samples: int) -> np.ndarray:
+        weights = self._weights_cache.get(n_samples)
+        if weights is None:
+            freqs = np.fft.rfftfreq(n_samples, d=1.0 / self.sample_rate).astype(np.float32)
+            weights = np.stack([freqs, np.ones_like(freqs)])
+            self._weights_cache[n_samples] = weights
+        return weights
 
 
 if __name__ == "__main__":  # pragma: no cover
     import sys
 
+    from core.paths import resolve_asset_path
     from inputs.audio.core.audio_file_input import AudioFileInput
 
     file_path = (
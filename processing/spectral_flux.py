@@ -1,10 +1,12 @@
-from typing import Any, Dict
+import math
+from typing import Any, Dict, Optional
 
 import numpy as np
 
 from core.paths import resolve_asset_path
 from inputs.audio.core.audio_device_input import AudioDeviceInput
 from processing.base_processing_operator import BaseProcessingOperator
+from processing.frame_spectrum import shared_spectrum
 
 
 class SpectralFlux(BaseProcessingOperator[float]):
@@ -22,23 +24,43 @@ class SpectralFlux(BaseProcessingOperator[float]):
     def __init__(self, audio_input: AudioDeviceInput):
         super().__init__()
         self.audio_input = audio_input
-        self.prev_spectrum = None
+        self.spectrum = shared_spectrum(audio_input)
+        self.prev_spectrum: Optional[np.ndarray] = None
+        # Scratch difference buffer, reused while the chunk size is stable
+        self._diff: Optional[np.ndarray] = None
 
     def process(self) -> float:
-        data = self.audio_input.peek()
-        if data is None or not isinstance(data, np.ndarray) or data.size == 0:
+        spectrum = self.spectrum.get()
+        if spectrum is None:
             return 0.0
-        if data.ndim == 2:
-            mono = data.mean(axis=1)
-        else:
-            mono = data
-        spectrum = np.abs(np.fft.rfft(mono))
-        if self.prev_spectrum is None:
+        if self.prev_spectrum is None or self.prev_spectrum.shape != spectrum.shape:
+            # Shared spectra are never written to, so keeping a reference is safe
             self.prev_spectrum = spectrum
+            self._diff = np.empty_like(spectrum)
             return 0.0
-        flux = np.sqrt(np.sum((spectrum - self.prev_spectrum) ** 2)) / len(spectrum)
+        diff = np.subtract(spectrum, self.prev_spectrum, out=self._diff)
+        # One sdot plus a libm sqrt on a Python float; no 0-d array round trip
+        flux = math.sqrt(float(np.dot(diff, diff))) / len(spectrum)
         self.prev_spectrum = spectrum
-        return float(flux)
+        return flux
+
+    def process_spectra(self, spectra: np.ndarray) -> np.ndarray:
+        """
+        Compute the flux across a batch of consecutive magnitude spectra.
+
+        Intended for offline analysis, e.g. over ``np.abs(np.fft.rfft(chunks, axis=1))``;
+        matches calling :meth:`process` on each
+        frame in turn from a fresh operator, so the first frame yields 0.0.
+
+        :param spectra: Magnitudes of shape ``(frames, bins)``.
+        :return: Array of ``frames`` flux values.
+        """
+        spectra = np.asarray(spectra, dtype=np.float32)
+        flux = np.zeros(len(spectra), dtype=np.float32)
+        if len(spectra) > 1:
+            diff = np.diff(spectra, axis=0)
+            flux[1:] = np.sqrt(np.einsum("ij,ij->i", diff, diff)) / spectra.shape[1]
+        return flux
 
 
 if __name__ == "__main__":  # pragma: no cover
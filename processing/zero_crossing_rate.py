@@ -1,10 +1,11 @@
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 import numpy as np
 
 from core.paths import resolve_asset_path
 from inputs.audio.core.audio_device_input import AudioDeviceInput
 from processing.base_processing_operator import BaseProcessingOperator
+from processing.downmix import to_mono
 
 
 class ZeroCrossingRate(BaseProcessingOperator[float]):
@@ -22,18 +23,46 @@ class ZeroCrossingRate(BaseProcessingOperator[float]):
     def __init__(self, audio_input: AudioDeviceInput):
         super().__init__()
         self.audio_input = audio_input
+        self._mono_buf: Optional[np.ndarray] = None
+        # Last chunk seen and its rate; inputs hand back the same array until
+        # they advance, so ticks faster than the audio reuse the result
+        self._last_data: Optional[np.ndarray] = None
+        self._last_rate = 0.0
 
     def process(self) -> float:
         data = self.audio_input.peek()
         if data is None or not isinstance(data, np.ndarray) or data.size == 0:
             return 0.0
-        if data.ndim == 2:
-            mono = data.mean(axis=1)
-        else:
-            mono = data
-        zero_crossings = np.where(np.diff(np.signbit(mono)))[0]
-        rate = len(zero_crossings) / len(mono) if len(mono) > 0 else 0.0
-        return float(rate)
+        if data is self._last_data:
+            return self._last_rate
+
+        mono = to_mono(data, self._mono_buf)
+        if mono is not data:
+            self._mono_buf = mono
+        # Count sign flips between neighbours without building an index array
+        signs = np.signbit(mono)
+        crossings = np.count_nonzero(signs[1:] ^ signs[:-1])
+        self._last_data = data
+        self._last_rate = crossings / len(mono)
+        return self._last_rate
+
+    def process_frames(self, frames: np.ndarray) -> np.ndarray:
+        """
+        Compute the zero crossing rate of a batch of chunks in one pass.
+
+        Intended for offline analysis of a preloaded file split into chunks;
+        matches :meth:`process` chunk by chunk.
+
+        :param frames: Chunks of shape ``(frames, n_samples)`` or ``(frames, n_samples, channels)``.
+        :return: Array of ``frames`` rates in [0, 1].
+        """
+        frames = np.asarray(frames)
+        if frames.ndim == 3:
+            frames = frames.mean(axis=2, dtype=np.float32)
+        if frames.shape[1] == 0:
+            return np.zeros(len(frames))
+        signs = np.signbit(frames)
+        return np.count_nonzero(signs[:, 1:] ^ signs[:, :-1], axis=1) / frames.shape[1]
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -7,10 +7,9 @@ from modules.composition.composite_module import CompositeOp
 from modules.core.base_av_module import BaseAVModule
 from modules.core.media_module import AspectMode, MediaModule, MediaParams
 from modules.effects.blur_module import BlurModule
-from modules.effects.feedback import FeedbackModule
 from modules.effects.level_module import LevelModule
 from processing.envelope import Envelope
-from processing.normalized_amplitude import CurveType, NormalizedAmplitudeOperator
+from processing.normalized_amplitude import BatchedAmplitudeOperator, CurveType
 
 
 def oblique_patch(width: int, height: int) -> ObliquePatch:
@@ -24,9 +23,10 @@ def oblique_patch(width: int, height: int) -> ObliquePatch:
 
     mix_LR = syntakt.get_main_lr_track()
 
-    t1, t2, t3, t4, t5, t8, t9, t10, t11 = [
-        syntakt.get_track(track_number)
-        for track_number in [
+    # One batched RMS pass over all the tracks we follow, instead of one operator each
+    tracks = BatchedAmplitudeOperator(
+        syntakt.get_audio_device,
+        channels=[
             SyntaktChannel.TRACK_1,
             SyntaktChannel.TRACK_2,
             SyntaktChannel.TRACK_3,
@@ -36,19 +36,14 @@ def oblique_patch(width: int, height: int) -> ObliquePatch:
             SyntaktChannel.TRACK_9,
             SyntaktChannel.TRACK_10,
             SyntaktChannel.TRACK_11,
-        ]
-    ]
-
-    a1 = NormalizedAmplitudeOperator(t1)
-    a2 = NormalizedAmplitudeOperator(t2)
-    a3 = NormalizedAmplitudeOperator(t3)
-    a4 = NormalizedAmplitudeOperator(t4)
-    a5 = NormalizedAmplitudeOperator(t5)
-    a8 = NormalizedAmplitudeOperator(t8)
+        ],
+        curves=[CurveType.NONE] * 6 + [CurveType.SIGMOID] + [CurveType.NONE] * 2,
+    )
+    a1, a2, a3, a4, a5, a8 = (tracks[i] for i in range(6))
 
-    a9 = Envelope(NormalizedAmplitudeOperator(t9, curve=CurveType.SIGMOID).process, decay=0.1)
-    a10 = Envelope(NormalizedAmplitudeOperator(t10).process, decay=0.1)
-    a11 = Envelope(NormalizedAmplitudeOperator(t11).process, decay=0.1)
+    a9 = Envelope(tracks[6].process, decay=0.1)
+    a10 = Envelope(tracks[7].process, decay=0.1)
+    a11 = Envelope(tracks[8].process, decay=0.1)
 
     broken_circles_module = BrokenCirclesModule(
         BrokenCirclesParams(
@@ -75,18 +70,17 @@ def oblique_patch(width: int, height: int) -> ObliquePatch:
 
     composite_module = level_module.mix(media_module, op=CompositeOp.ATOP)
 
-    feedback_module = pauric_squares_module.to(
-        FeedbackModule, feedback_strength=0.5, direction=(-0.01, 0.010)
-    )
-
     blur_module = pauric_squares_module.to(BlurModule, blur_amount=10000)
 
     def tick_callback(t: float) -> BaseAVModule:
-        pauric_squares_module.params.tile_size = int(
-            1 + 10 * max(a10.process(), a11.process())
-        )
+        # Read each operator once per tick; the envelopes are stateful
+        v10 = a10.process()
+        v11 = a11.process()
+        v8 = a8.process()
+
+        pauric_squares_module.params.tile_size = int(1 + 10 * max(v10, v11))
 
-        if a8.process() > 0.001:
+        if v8 > 0.001:
             level_module.params.invert = True
             return composite_module
         else:
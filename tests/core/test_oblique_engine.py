@@ -30,6 +30,86 @@ def test_get_performance_stats():
     assert "avg_fps" in stats
 
 
+def test_sleep_until_reaches_deadline():
+    setup_stubs()
+    engine_mod = load_module("core.oblique_engine", ROOT / "core" / "oblique_engine.py")
+    import time
+
+    deadline = time.perf_counter() + 0.005
+    engine_mod.sleep_until(deadline)
+    assert time.perf_counter() >= deadline
+
+    # A deadline already in the past returns immediately
+    start = time.perf_counter()
+    engine_mod.sleep_until(start - 1.0)
+    assert time.perf_counter() - start < 0.01
+
+
+def test_sleep_until_rewaits_after_early_wakeup():
+    setup_stubs()
+    engine_mod = load_module("core.oblique_engine", ROOT / "core" / "oblique_engine.py")
+    import time
+
+    timeouts = []
+
+    def wake_early(timeout):
+        # Returns at once, like glfw.wait_events_timeout when an event is queued
+        timeouts.append(timeout)
+        if len(timeouts) == 1:
+            return
+        time.sleep(timeout)
+
+    deadline = time.perf_counter() + 0.01
+    engine_mod.sleep_until(deadline, wake_early)
+    assert time.perf_counter() >= deadline
+    assert len(timeouts) >= 2
+
+
+def test_next_frame_deadline_keeps_grid_and_resyncs_after_overrun():
+    setup_stubs()
+    engine_mod = load_module("core.oblique_engine", ROOT / "core" / "oblique_engine.py")
+    import time
+
+    now = time.perf_counter()
+    assert engine_mod.next_frame_deadline(now + 1.0, 0.5) == now + 1.5
+
+    # A frame that overran the next slot restarts the grid instead of catching up
+    resynced = engine_mod.next_frame_deadline(now - 10.0, 0.5)
+    assert now + 0.5 <= resynced <= time.perf_counter() + 0.5
+
+
+def test_warm_up_patch_logs_failures(monkeypatch):
+    setup_stubs()
+    patch_mod = load_module("core.oblique_patch", ROOT / "core" / "oblique_patch.py")
+    engine_mod = load_module("core.oblique_engine", ROOT / "core" / "oblique_engine.py")
+    warnings = []
+    monkeypatch.setattr(engine_mod, "warning", warnings.append)
+
+    def broken_tick(t):
+        raise ValueError("boom")
+
+    engine_mod.warm_up_patch(patch_mod.ObliquePatch(broken_tick), object())
+    assert len(warnings) == 1 and "boom" in warnings[0]
+
+
+def test_warm_up_patch_ticks_at_given_time():
+    setup_stubs()
+    patch_mod = load_module("core.oblique_patch", ROOT / "core" / "oblique_patch.py")
+    engine_mod = load_module("core.oblique_engine", ROOT / "core" / "oblique_engine.py")
+    ticks = []
+
+    class Module:
+        def warmup(self, ctx):
+            pass
+
+    def tick(t):
+        ticks.append(t)
+        return Module()
+
+    engine_mod.warm_up_patch(patch_mod.ObliquePatch(tick), object(), 12.5)
+    assert ticks == [12.5]
+
+
 def test_render_patch_requires_context():
     setup_stubs()
     patch_mod = load_module("core.oblique_patch", ROOT / "core" / "oblique_patch.py")
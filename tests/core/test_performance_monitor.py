@@ -4,13 +4,13 @@ from pathlib import Path
 
 import pytest
 
-from tests.utils.stubs import setup_stubs, load_module
+from tests.utils.stubs import get_module, setup_stubs
 
 
 def load_performance_monitor():
     setup_stubs()
     path = Path(__file__).resolve().parents[2] / "core" / "performance_monitor.py"
-    module = load_module("core.performance_monitor", path)
+    module = get_module("core.performance_monitor", path)
     return module.PerformanceMonitor
 
 
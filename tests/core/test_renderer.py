@@ -292,3 +292,82 @@ def test_render_fullscreen_quad_preserves_input_texture_filter(monkeypatch):
     )
 
     assert texture.filter == ("custom", "custom")
+
+
+def test_render_to_texture_reuses_framebuffer(monkeypatch):
+    setup_stubs()
+    renderer = load_module("core.renderer", ROOT / "core" / "renderer.py")
+    import moderngl
+
+    ctx = moderngl.create_context()
+    created: list[object] = []
+    released: list[object] = []
+
+    class CountingFramebuffer:
+        def use(self):
+            return None
+
+        def release(self):
+            released.append(self)
+
+    def framebuffer(color_attachments):
+        fbo = CountingFramebuffer()
+        created.append(fbo)
+        return fbo
+
+    monkeypatch.setattr(ctx, "framebuffer", framebuffer)
+    monkeypatch.setattr(renderer, "render_fullscreen_quad", lambda *args, **kwargs: None)
+    renderer.set_ctx(ctx)
+    renderer.cleanup_texture_cache()
+
+    shader_path = str(resolve_asset_path("shaders/passthrough.frag"))
+    module = object()
+    first = renderer.render_to_texture(module, 4, 4, shader_path, {}, 0, cache_tag="a")
+    second = renderer.render_to_texture(module, 4, 4, shader_path, {}, 0, cache_tag="a")
+    assert first is second
+    assert len(created) == 1 and not released
+
+    renderer.release_texture_reference(first)
+    assert released == created
+    assert not renderer._framebuffer_cache
+
+
+def test_render_to_texture_failed_render_does_not_cache_framebuffer(monkeypatch):
+    setup_stubs()
+    renderer = load_module("core.renderer", ROOT / "core" / "renderer.py")
+    import moderngl
+
+    ctx = moderngl.create_context()
+
+    class TrackingFramebuffer:
+        def __init__(self, color_attachments):
+            self.texture = color_attachments[0]
+
+        def use(self):
+            return None
+
+        def release(self):
+            return None
+
+    calls = []
+
+    def render(*args, **kwargs):
+        calls.append(args)
+        if len(calls) == 1:
+            raise RuntimeError("boom")
+
+    monkeypatch.setattr(ctx, "framebuffer", TrackingFramebuffer)
+    monkeypatch.setattr(renderer, "render_fullscreen_quad", render)
+    monkeypatch.setattr(renderer, "error", lambda *args, **kwargs: None)
+    renderer.set_ctx(ctx)
+    renderer.cleanup_texture_cache()
+
+    shader_path = str(resolve_asset_path("shaders/passthrough.frag"))
+    module = object()
+    with pytest.raises(RuntimeError):
+        renderer.render_to_texture(module, 4, 4, shader_path, {}, 0, cache_tag="a")
+    assert not renderer._framebuffer_cache
+
+    tex = renderer.render_to_texture(module, 4, 4, shader_path, {}, 0, cache_tag="a")
+    (key,) = renderer._framebuffer_cache
+    assert renderer._framebuffer_cache[key].texture is tex
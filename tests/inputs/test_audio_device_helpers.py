@@ -98,3 +98,27 @@ def test_audio_device_like_raises_on_no_match(fake_sounddevice):
 def test_find_audio_device_like_validates_regex(fake_sounddevice):
     with pytest.raises(ValueError):
         fake_sounddevice.find_audio_device_like("[unclosed")
+
+
+def test_peek_reuses_filtered_chunk_until_next_chunk(audio_module):
+    import collections
+    import queue
+
+    import numpy as np
+
+    device = audio_module.AudioDeviceInput.__new__(audio_module.AudioDeviceInput)
+    device._channel_indices = None
+    device._audio_queue = queue.Queue()
+    device._chunk_history = collections.deque(maxlen=audio_module.AudioDeviceInput.HISTORY_SIZE)
+    device._peek_cache = {}
+
+    device._chunk_history.append(np.arange(12, dtype=np.float32).reshape(4, 3))
+    first = device.peek(channels=[0, 2])
+    assert first is device.peek(channels=[0, 2])
+    np.testing.assert_array_equal(first, [[0, 2], [3, 5], [6, 8], [9, 11]])
+    assert device.peek(channels=[1]) is not first
+
+    device._audio_queue.put(np.zeros((4, 3), dtype=np.float32))
+    second = device.peek(channels=[0, 2])
+    assert second is not first
+    assert not second.any()
@@ -93,7 +93,7 @@ def test_render_texture_invokes_renderer(monkeypatch):
 
     called = {}
 
-    def fake_render_to_texture(module_arg, width, height, frag_shader_path, uniforms, filter, cache_tag):
+    def fake_render_to_texture(module_arg, width, height, frag_shader_path, uniforms, filter, cache_tag, dtype):
         called["args"] = (module_arg, width, height, frag_shader_path, uniforms)
         return dummy_tex
 
@@ -108,6 +108,26 @@ def test_render_texture_invokes_renderer(monkeypatch):
     assert called["args"][4]["u_resolution"] == (2, 3)
 
 
+def test_render_texture_uses_module_texture_dtype(monkeypatch):
+    setup_stubs()
+    import moderngl
+
+    module = _make_module()
+    module.texture_pass.dtype = "f2"
+    dtypes: list[str] = []
+
+    def fake_render_to_texture(module_arg, width, height, frag_shader_path, uniforms, filter, cache_tag, dtype):
+        dtypes.append(dtype)
+        return moderngl.Texture()
+
+    base_mod = sys.modules["modules.core.base_av_module"]
+    monkeypatch.setattr(base_mod, "render_to_texture", fake_render_to_texture)
+
+    module.render_texture(moderngl.create_context(), 2, 2, 0.0)
+    assert dtypes == ["f2"]
+    assert _make_module().texture_pass.dtype == "f4"
+
+
 def test_ping_pong_history_evicts_stale_resolution(monkeypatch):
     setup_stubs()
     import moderngl
@@ -157,6 +177,7 @@ def test_ping_pong_history_evicts_stale_resolution(monkeypatch):
         uniforms,
         filter,
         cache_tag,
+        dtype,
     ):
         tex = DummyTexture(f"{cache_tag}:{width}x{height}")
         created.append(tex)
@@ -225,6 +246,7 @@ def test_texture_pass_uniforms_require_explicit_u_prefix(monkeypatch):
         uniforms,
         filter,
         cache_tag,
+        dtype,
     ):
         recorded_uniforms.append(dict(uniforms))
         return moderngl.Texture()
@@ -286,6 +308,7 @@ def test_texture_pass_can_opt_out_of_parent_uniform_inheritance(monkeypatch):
         uniforms,
         filter,
         cache_tag,
+        dtype,
     ):
         captured_by_tag[cache_tag] = dict(uniforms)
         return moderngl.Texture()
@@ -340,6 +363,7 @@ def test_texture_pass_filter_override_is_opt_in(monkeypatch):
         uniforms,
         filter,
         cache_tag,
+        dtype,
     ):
         recorded_filters.append(filter)
         return moderngl.Texture()
@@ -351,3 +375,42 @@ def test_texture_pass_filter_override_is_opt_in(monkeypatch):
     module.render_texture(moderngl.create_context(), 4, 4, 0.0, filter=moderngl.NEAREST)
 
     assert recorded_filters == [moderngl.LINEAR]
+
+
+def test_warmup_compiles_upstream_graph_once(monkeypatch):
+    setup_stubs()
+    import moderngl
+
+    base_mod = sys.modules.get("modules.core.base_av_module")
+    if base_mod is None:
+        base_mod = load_module("modules.core.base_av_module", ROOT / "modules/core/base_av_module.py")
+    BaseAVModule = base_mod.BaseAVModule
+    BaseAVParams = base_mod.BaseAVParams
+    TexturePass = base_mod.TexturePass
+
+    compiled: list[str] = []
+    monkeypatch.setattr(base_mod, "precompile_shader", lambda ctx, path: compiled.append(path))
+
+    @dataclass
+    class Params(BaseAVParams):
+        width: int = 1
+        height: int = 1
+        inputs: tuple = ()
+
+    class Source(BaseAVModule[Params, dict]):
+        frag_shader_path = "shaders/source.frag"
+        noise_pass = TexturePass(frag_shader_path="shaders/noise.frag")
+
+        def prepare_uniforms(self, t: float) -> dict:
+            return {}
+
+    class Effect(Source):
+        frag_shader_path = "shaders/effect.frag"
+
+    source = Source(Params())
+    effect = Effect(Params(inputs=(source, source)))
+
+    effect.warmup(moderngl.create_context())
+    assert sorted(compiled) == sorted(
+        ["shaders/effect.frag", "shaders/noise.frag", "shaders/source.frag"]
+    )
@@ -0,0 +1,26 @@
+from pathlib import Path
+
+import numpy as np
+
+from tests.utils.stubs import setup_stubs, load_module
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+def test_to_mono_averages_channels_into_reused_buffer() -> None:
+    setup_stubs()
+    mod = load_module("processing.downmix", ROOT / "processing" / "downmix.py")
+
+    stereo = np.array([[1.0, 0.0], [0.5, 0.5], [-1.0, 1.0]])
+    mono = mod.to_mono(stereo)
+    assert mono.dtype == np.float32
+    assert np.allclose(mono, stereo.mean(axis=1))
+
+    assert mod.to_mono(stereo * 2, mono) is mono
+    assert np.allclose(mono, (stereo * 2).mean(axis=1))
+
+    quad = np.arange(12, dtype=np.float32).reshape(3, 4)
+    assert np.allclose(mod.to_mono(quad, mono), quad.mean(axis=1))
+
+    signal = np.ones(5)
+    assert mod.to_mono(signal, mono) is signal
@@ -2,14 +2,14 @@ from pathlib import Path
 
 import numpy as np
 
-from tests.utils.stubs import setup_stubs, load_module
+from tests.utils.stubs import get_module, setup_stubs
 
 ROOT = Path(__file__).resolve().parents[2]
 
 
 def test_envelope_smoothing() -> None:
     setup_stubs()
-    mod = load_module("processing.envelope", ROOT / "processing" / "envelope.py")
+    mod = get_module("processing.envelope", ROOT / "processing" / "envelope.py")
 
     values = [1.0, 0.0]
 
@@ -19,3 +19,13 @@ def test_envelope_smoothing() -> None:
     env = mod.Envelope(input_fn, decay=0.5)
     assert np.isclose(env.process(), 0.5)
     assert np.isclose(env.process(), 0.25)
+
+
+def test_envelope_decay_can_change_between_ticks() -> None:
+    setup_stubs()
+    mod = get_module("processing.envelope", ROOT / "processing" / "envelope.py")
+
+    env = mod.Envelope(lambda: 1.0, decay=0.5)
+    assert np.isclose(env.process(), 0.5)
+    env.decay = 1.0
+    assert np.isclose(env.process(), 1.0)
@@ -1,24 +1,25 @@
+from collections import deque
 from pathlib import Path
 
 import numpy as np
 
-from tests.utils.stubs import setup_stubs, load_module
+from tests.utils.stubs import get_module, setup_stubs
 
 ROOT = Path(__file__).resolve().parents[2]
 
 
 class DummyAudio:
     def __init__(self, chunks, sample_rate: int = 48000) -> None:
-        self.chunks = list(chunks)
+        self.chunks = deque(chunks)
         self.sample_rate = sample_rate
 
     def peek(self, n_buffers: int = 1, channels=None):  # pragma: no cover - interface placeholder
-        return self.chunks.pop(0) if self.chunks else None
+        return self.chunks.popleft() if self.chunks else None
 
 
 def test_fft_bands_basic() -> None:
     setup_stubs()
-    mod = load_module("processing.fft_bands", ROOT / "processing" / "fft_bands.py")
+    mod = get_module("processing.fft_bands", ROOT / "processing" / "fft_bands.py")
 
     chunks = [
         np.array([], dtype=np.float32),
@@ -30,7 +31,8 @@ def test_fft_bands_basic() -> None:
     fft = mod.FFTBands(audio, n_fft=8, num_bands=4, smoothing_factor=0.5)
 
     assert fft.process() == [0.0] * 4  # empty chunk
-    assert fft.process() == [0.0] * 4  # still filling buffer
+    partial = fft.process()  # window not yet full, zero-padded head
+    assert len(partial) == 4 and any(v > 0.0 for v in partial)
     res = fft.process()
     assert len(res) == 4 and all(0.0 <= v <= 1.0 for v in res)
     res2 = fft.process()
@@ -39,8 +41,48 @@ def test_fft_bands_basic() -> None:
 
 def test_fft_bands_missing_audio() -> None:
     setup_stubs()
-    mod = load_module("processing.fft_bands", ROOT / "processing" / "fft_bands.py")
+    mod = get_module("processing.fft_bands", ROOT / "processing" / "fft_bands.py")
 
     audio = DummyAudio([None])
     fft = mod.FFTBands(audio, n_fft=8, num_bands=2)
     assert fft.process() == [0.0, 0.0]
+
+
+class RepeatingAudio:
+    def __init__(self, chunk, sample_rate: int = 48000) -> None:
+        self.chunk = chunk
+        self.sample_rate = sample_rate
+
+    def peek(self, n_buffers: int = 1, channels=None):  # pragma: no cover - interface placeholder
+        return self.chunk
+
+
+def test_fft_bands_pushes_each_chunk_once() -> None:
+    setup_stubs()
+    mod = get_module("processing.fft_bands", ROOT / "processing" / "fft_bands.py")
+
+    audio = RepeatingAudio(np.arange(1, 5, dtype=np.float32))
+    fft = mod.FFTBands(audio, n_fft=8, num_bands=2, smoothing_factor=1.0)
+
+    first = fft.process()
+    np.testing.assert_array_equal(fft._ring, [0, 0, 0, 0, 1, 2, 3, 4])
+    assert fft.process() == first  # same chunk object: not pushed again
+    np.testing.assert_array_equal(fft._ring, [0, 0, 0, 0, 1, 2, 3, 4])
+
+    audio.chunk = np.arange(5, 9, dtype=np.float32)
+    fft.process()
+    np.testing.assert_array_equal(fft._ring, np.arange(1, 9))
+
+
+def test_fft_bands_match_per_band_means() -> None:
+    setup_stubs()
+    mod = get_module("processing.fft_bands", ROOT / "processing" / "fft_bands.py")
+
+    rng = np.random.default_rng(0)
+    audio = RepeatingAudio(rng.standard_normal(1024).astype(np.float32))
+    fft = mod.FFTBands(audio, n_fft=1024, num_bands=24, smoothing_factor=0.0)
+    levels = fft.process()
+
+    means = np.array([fft._mag[b].mean() for b in fft.band_bins])
+    expected = np.clip((20 * np.log10(np.maximum(means, 1e-9)) - fft.db_floor) * fft.scale, 0.0, 1.0)
+    assert np.allclose(levels, expected, atol=1e-6)
@@ -0,0 +1,64 @@
+from pathlib import Path
+
+import numpy as np
+
+from tests.utils.stubs import setup_stubs, load_module
+
+ROOT = Path(__file__).resolve().parents[2]
+
+
+class CountingInput:
+    def __init__(self, data):
+        self.data = data
+        self.peeks = 0
+
+    def peek(self):  # pragma: no cover - signature placeholder
+        self.peeks += 1
+        return self.data
+
+
+def test_frame_spectrum_reuses_result_for_same_chunk(monkeypatch) -> None:
+    setup_stubs()
+    mod = load_module("processing.frame_spectrum", ROOT / "processing" / "frame_spectrum.py")
+
+    calls = []
+    rfft = np.fft.rfft
+    monkeypatch.setattr(np.fft, "rfft", lambda x, **kw: calls.append(len(x)) or rfft(x, **kw))
+
+    audio = CountingInput(np.ones((16, 2), dtype=np.float32))
+    spectrum = mod.shared_spectrum(audio)
+    assert mod.shared_spectrum(audio) is spectrum
+
+    first = spectrum.get()
+    assert first is not None and first.shape == (9,)
+    assert spectrum.n_samples == 16
+
+    # The cache is keyed on the chunk object, not its contents
+    assert spectrum.get() is first
+    assert len(calls) == 1
+    audio.data = audio.data.copy()
+    assert spectrum.get() is not first
+    assert len(calls) == 2
+
+    audio.data = np.zeros(16, dtype=np.float32)
+    assert spectrum.get() is not first
+    assert len(calls) == 3
+
+    audio.data = None
+    assert spectrum.get() is None
+
+
+def test_frame_spectrum_does_not_write_into_mono_input() -> None:
+    setup_stubs()
+    mod = load_module("processing.frame_spectrum", ROOT / "processing" / "frame_spectrum.py")
+
+    mono = np.linspace(-1.0, 1.0, 16, dtype=np.float32)
+    original = mono.copy()
+    audio = CountingInput(mono)
+    spectrum = mod.FrameSpectrum(audio)
+    spectrum.get()
+
+    # A later stereo chunk of the same length must not reuse the caller's array
+    audio.data = np.zeros((16, 2), dtype=np.float32)
+    spectrum.get()
+    assert np.array_equal(mono, original)
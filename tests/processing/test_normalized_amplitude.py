@@ -3,7 +3,7 @@ from pathlib import Path
 import numpy as np
 import pytest
 
-from tests.utils.stubs import setup_stubs, load_module
+from tests.utils.stubs import get_module, setup_stubs
 
 
 ROOT = Path(__file__).resolve().parents[2]
@@ -19,7 +19,7 @@ class DummyInput:
 
 def test_normalized_amplitude_curves() -> None:
     setup_stubs()
-    mod = load_module("processing.normalized_amplitude", ROOT / "processing" / "normalized_amplitude.py")
+    mod = get_module("processing.normalized_amplitude", ROOT / "processing" / "normalized_amplitude.py")
 
     data = np.ones((4, 1), dtype=np.float32) * 0.5
 
@@ -44,7 +44,7 @@ def test_normalized_amplitude_curves() -> None:
 
 def test_normalized_amplitude_edge_cases() -> None:
     setup_stubs()
-    mod = load_module("processing.normalized_amplitude", ROOT / "processing" / "normalized_amplitude.py")
+    mod = get_module("processing.normalized_amplitude", ROOT / "processing" / "normalized_amplitude.py")
 
     op = mod.NormalizedAmplitudeOperator(DummyInput(np.array([])))
     assert op.process() == 0.0
@@ -55,3 +55,77 @@ def test_normalized_amplitude_edge_cases() -> None:
     op = mod.NormalizedAmplitudeOperator(DummyInput(np.array([0.1, 0.1])))
     assert op.process() > 0.0
 
+
+
+def test_normalized_amplitude_reuses_result_for_same_chunk() -> None:
+    setup_stubs()
+    mod = get_module("processing.normalized_amplitude", ROOT / "processing" / "normalized_amplitude.py")
+
+    audio = DummyInput(np.full((4, 2), 0.5, dtype=np.float32))
+    op = mod.NormalizedAmplitudeOperator(audio)
+    first = op.process()
+    assert first > 0.0
+
+    # Same array object: cached result, even though the contents changed in place
+    audio._data[:] = 0.0
+    assert op.process() == first
+
+    audio._data = np.zeros((4, 2), dtype=np.float32)
+    assert op.process() == 0.0
+
+
+class MultiChannelInput:
+    def __init__(self, data):
+        self._data = data
+
+    def peek(self, n_buffers=1, channels=None):  # pragma: no cover - signature placeholder
+        return self._data[:, channels]
+
+
+def test_batched_amplitude_matches_single_channel_operator() -> None:
+    setup_stubs()
+    mod = get_module("processing.normalized_amplitude", ROOT / "processing" / "normalized_amplitude.py")
+
+    rng = np.random.default_rng(0)
+    data = (rng.standard_normal((256, 4)) * [0.5, 0.05, 0.0, 0.2]).astype(np.float32)
+    curves = [mod.CurveType.NONE, mod.CurveType.SIGMOID, mod.CurveType.SIGMOID, mod.CurveType.LOG]
+    audio = MultiChannelInput(data)
+    batch = mod.BatchedAmplitudeOperator(audio, [0, 1, 2, 3], curves=curves)
+
+    expected = [
+        mod.NormalizedAmplitudeOperator(DummyInput(data[:, ch].copy()), curve=curve).process()
+        for ch, curve in enumerate(curves)
+    ]
+    np.testing.assert_allclose(batch.process(), expected, rtol=1e-5)
+    assert [batch[i].process() for i in range(len(batch))] == pytest.approx(expected, rel=1e-5)
+    assert batch[2].process() == 0.0
+
+    with pytest.raises(ValueError):
+        mod.BatchedAmplitudeOperator(audio, [0, 1], curves=[mod.CurveType.NONE])
+
+    # An input that drops a requested channel must not shift curves onto other columns
+    with pytest.raises(ValueError):
+        mod.BatchedAmplitudeOperator(DummyInput(data[:, :3]), [0, 1, 2, 3], curves=curves).values()
+
+
+def test_scalar_curves_match_array_curves() -> None:
+    setup_stubs()
+    mod = get_module("processing.normalized_amplitude", ROOT / "processing" / "normalized_amplitude.py")
+
+    levels = np.linspace(0.0, 1.0, 11)
+    for curve in mod.CurveType:
+        expected = mod._apply_curve(levels, curve)
+        actual = [mod._apply_curve_scalar(float(x), curve) for x in levels]
+        assert np.allclose(actual, expected)
+
+
+def test_normalized_amplitude_rejects_unknown_curve() -> None:
+    setup_stubs()
+    mod = get_module("processing.normalized_amplitude", ROOT / "processing" / "normalized_amplitude.py")
+
+    with pytest.raises(ValueError):
+        mod.NormalizedAmplitudeOperator(DummyInput(None), curve="steep")
+
+    op = mod.NormalizedAmplitudeOperator(DummyInput(np.full(4, 0.5)), curve=mod.CurveType.SQRT)
+    op.curve = mod.CurveType.NONE
+    assert np.isclose(op.process(), (20 * np.log10(0.5) + 60) / 60)
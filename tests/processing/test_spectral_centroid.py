@@ -2,7 +2,7 @@ from pathlib import Path
 
 import numpy as np
 
-from tests.utils.stubs import setup_stubs, load_module
+from tests.utils.stubs import get_module, setup_stubs
 
 
 ROOT = Path(__file__).resolve().parents[2]
@@ -18,7 +18,7 @@ class DummyInput:
 
 def test_spectral_centroid_basic() -> None:
     setup_stubs()
-    mod = load_module("processing.spectral_centroid", ROOT / "processing" / "spectral_centroid.py")
+    mod = get_module("processing.spectral_centroid", ROOT / "processing" / "spectral_centroid.py")
 
     sr = 44100
     t = np.arange(sr // 100) / sr
@@ -32,7 +32,7 @@ def test_spectral_centroid_basic() -> None:
 
 def test_spectral_centroid_branches() -> None:
     setup_stubs()
-    mod = load_module("processing.spectral_centroid", ROOT / "processing" / "spectral_centroid.py")
+    mod = get_module("processing.spectral_centroid", ROOT / "processing" / "spectral_centroid.py")
 
     sr = 44100
     t = np.arange(sr // 100) / sr
@@ -56,3 +56,19 @@ def test_spectral_centroid_branches() -> None:
     op = mod.SpectralCentroid(DummyInput(make(10000)))
     assert op.process() > 0.0
 
+
+
+def test_spectral_centroid_batch_matches_process() -> None:
+    setup_stubs()
+    mod = get_module("processing.spectral_centroid", ROOT / "processing" / "spectral_centroid.py")
+
+    sr = 44100
+    t = np.arange(2048) / sr
+    chunks = [np.sin(2 * np.pi * f * t).astype(np.float32) for f in (500, 3000, 6000, 12000)]
+    chunks.append(np.zeros(2048, dtype=np.float32))
+
+    expected = [mod.SpectralCentroid(DummyInput(c)).process() for c in chunks]
+    spectra = np.abs(np.fft.rfft(np.stack(chunks), axis=1))
+    batch = mod.SpectralCentroid(DummyInput(None)).process_spectra(spectra, 2048)
+
+    np.testing.assert_allclose(batch, expected, rtol=1e-5, atol=1e-6)
@@ -1,3 +1,4 @@
+from collections import deque
 from pathlib import Path
 import sys
 import types
@@ -21,10 +22,10 @@ def load_spectral_flux():
 
 class DummyAudio:
     def __init__(self, chunks):
-        self.chunks = list(chunks)
+        self.chunks = deque(chunks)
 
     def peek(self):  # pragma: no cover - interface placeholder
-        return self.chunks.pop(0) if self.chunks else None
+        return self.chunks.popleft() if self.chunks else None
 
 
 def test_spectral_flux_basic() -> None:
@@ -44,3 +45,28 @@ def test_spectral_flux_edge_cases() -> None:
     op = mod.SpectralFlux(audio)
     op.process()
     assert op.process() > 0.0
+
+
+def test_spectral_flux_matches_reference_across_frames() -> None:
+    mod = load_spectral_flux()
+    rng = np.random.default_rng(0)
+    frames = [rng.standard_normal(64).astype(np.float32) for _ in range(4)]
+    op = mod.SpectralFlux(DummyAudio(frames))
+
+    prev = None
+    for frame in frames:
+        spectrum = np.abs(np.fft.rfft(frame))
+        expected = 0.0 if prev is None else np.sqrt(np.sum((spectrum - prev) ** 2)) / len(spectrum)
+        assert np.isclose(op.process(), expected, rtol=1e-4)
+        prev = spectrum
+
+
+def test_spectral_flux_batch_matches_process() -> None:
+    mod = load_spectral_flux()
+    rng = np.random.default_rng(1)
+    frames = [rng.standard_normal(64).astype(np.float32) for _ in range(5)]
+
+    op = mod.SpectralFlux(DummyAudio(frames))
+    expected = [op.process() for _ in frames]
+    spectra = np.abs(np.fft.rfft(np.stack(frames), axis=1))
+    assert np.allclose(mod.SpectralFlux(DummyAudio([])).process_spectra(spectra), expected, rtol=1e-4)
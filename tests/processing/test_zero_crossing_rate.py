@@ -36,6 +36,7 @@ def load_zero_crossing_rate() -> Type[Any]:
 
     # Create processing package and base operator
     processing_pkg = types.ModuleType("processing")
+    processing_pkg.__path__ = [str(Path(__file__).resolve().parents[2] / "processing")]
     sys.modules["processing"] = processing_pkg
 
     base_module = types.ModuleType("processing.base_processing_operator")
@@ -93,3 +94,24 @@ def test_zero_crossing_rate_none_and_stereo() -> None:
     stereo = np.array([[1.0, 1.0], [-1.0, -1.0], [1.0, 1.0], [-1.0, -1.0]])
     zcr = ZeroCrossingRate(DummyAudio(stereo))
     assert np.isclose(zcr.process(), 0.75)
+
+
+def test_zero_crossing_rate_reuses_result_for_same_chunk() -> None:
+    audio = DummyAudio(np.array([1.0, -1.0, 1.0, -1.0]))
+    zcr = ZeroCrossingRate(audio)
+    assert np.isclose(zcr.process(), 0.75)
+
+    # Same array object: cached result, even though the contents changed in place
+    audio._data[:] = 1.0
+    assert np.isclose(zcr.process(), 0.75)
+
+    audio._data = np.array([1.0, 1.0, 1.0, -1.0])
+    assert np.isclose(zcr.process(), 0.25)
+
+
+def test_zero_crossing_rate_batch_matches_process() -> None:
+    rng = np.random.default_rng(0)
+    frames = rng.standard_normal((5, 64, 2)).astype(np.float32)
+
+    expected = [ZeroCrossingRate(DummyAudio(frame)).process() for frame in frames]
+    assert np.allclose(ZeroCrossingRate(DummyAudio(None)).process_frames(frames), expected)
@@ -90,7 +90,7 @@ void main() {
     )
 
 
-def _rotating_rect_patch(width: int, height: int, shader_path: str) -> ObliquePatch:
+def _rotating_rect_patch(width: int, height: int, shader_path: str, texture_dtype: str = "f4") -> ObliquePatch:
     @dataclass
     class RotatingRectParams(BaseAVParams):
         width: int
@@ -104,6 +104,7 @@ def _rotating_rect_patch(width: int, height: int, shader_path: str) -> ObliquePa
 
         def __init__(self, params: RotatingRectParams, shader_file: str) -> None:
             self.frag_shader_path = shader_file
+            self.texture_dtype = texture_dtype
             super().__init__(params)
 
         def prepare_uniforms(self, t: float) -> RotatingRectUniforms:
@@ -166,6 +167,18 @@ class TestRenderFrame:
         assert arr.min() >= 0.0
         assert arr.max() <= 1.0
 
+    def test_half_float_root(self, tmp_path):
+        shader_path = tmp_path / "rotating-rect.frag"
+        _rotating_rect_shader(shader_path)
+        patch = _rotating_rect_patch(WIDTH, HEIGHT, str(shader_path), texture_dtype="f2")
+
+        with HeadlessRenderer(patch, WIDTH, HEIGHT) as r:
+            arr = r.render_frame(0.0)
+
+        assert arr.shape == (HEIGHT, WIDTH, 4)
+        assert arr.dtype == np.float32
+        assert arr.max() == 1.0
+
 
 @_skip_if_no_gpu
 class TestRenderToFile:
@@ -1,5 +1,4 @@
 import sys
-import sys
 import types
 import importlib.util
 from pathlib import Path
@@ -23,12 +22,47 @@ def load_module(name: str, path: Path):
     return module
 
 
+def get_module(name: str, path: Path):
+    """Return ``sys.modules[name]`` if it was loaded from *path*, otherwise load it.
+
+    For tests that only need the module's classes and functions; use
+    :func:`load_module` when a freshly executed module (clean globals) is required.
+    """
+    module = sys.modules.get(name)
+    module_file = getattr(module, "__file__", None)
+    if module_file is not None and Path(module_file) == Path(path):
+        return module
+    return load_module(name, path)
+
+
+_ROOT = Path(__file__).resolve().parents[1].parent
+
+# Everything setup_stubs() installs; once all are present a call has nothing to do
+_STUBBED_MODULES = (
+    "glfw",
+    "moderngl",
+    "sounddevice",
+    "core",
+    "core.logger",
+    "core.renderer",
+    "inputs.audio.core.base_audio_input",
+    "modules",
+    "modules.core",
+    "modules.core.base_av_module",
+)
+
+
 def setup_stubs() -> None:
     """Install stub modules for external dependencies."""
-    root = Path(__file__).resolve().parents[1].parent
+    root = _ROOT
     if str(root) not in sys.path:
         sys.path.insert(0, str(root))
 
+    # Checked per call rather than with a sentinel, since tests may drop or
+    # replace entries in sys.modules between calls
+    if all(name in sys.modules for name in _STUBBED_MODULES):
+        return
+
     if "glfw" not in sys.modules:
         sys.modules["glfw"] = types.SimpleNamespace(
             CONTEXT_VERSION_MAJOR=3,